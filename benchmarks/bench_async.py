@@ -0,0 +1,58 @@
+"""Overhead of `@strict` per await, with many concurrent calls in one loop.
+
+    PYTHONPATH=. python benchmarks/bench_async.py [--tasks N] [--calls N]
+"""
+from argparse import ArgumentParser
+from asyncio import gather, run, sleep
+from time import perf_counter
+
+from strict_hint import strict
+
+
+async def plain(a, b):
+    await sleep(0)
+    return a + b
+
+
+@strict
+async def checked(a: int, b: int) -> int:
+    await sleep(0)
+    return a + b
+
+
+async def worker(func, calls: int) -> None:
+    for i in range(calls):
+        await func(i, 1)
+
+
+async def measure(func, tasks: int, calls: int) -> float:
+    start = perf_counter()
+    await gather(*(worker(func, calls) for _ in range(tasks)))
+    return perf_counter() - start
+
+
+def main() -> None:
+    parser = ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--tasks', type=int, default=1000)
+    parser.add_argument('--calls', type=int, default=100)
+    parser.add_argument('--repeat', type=int, default=5)
+    options = parser.parse_args()
+
+    total = options.tasks * options.calls
+    results = {}
+    for name, func in (('plain', plain), ('strict', checked)):
+        results[name] = min(
+            run(measure(func, options.tasks, options.calls))
+            for _ in range(options.repeat)
+        ) / total * 1e9
+
+    print('%d tasks x %d awaits' % (options.tasks, options.calls))
+    for name, ns in results.items():
+        print('%-8s %8.0f ns/await' % (name, ns))
+    print('%-8s %8.0f ns/await' % (
+        'overhead', results['strict'] - results['plain']
+    ))
+
+
+if __name__ == '__main__':
+    main()
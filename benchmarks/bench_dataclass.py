@@ -0,0 +1,73 @@
+"""Instances of dataclass created per second, with and without checks.
+
+    PYTHONPATH=. python benchmarks/bench_dataclass.py \
+        [--number 200000] [--repeat 5]
+
+Compares plain dataclass against `@strict` on the class, which wraps its
+`__init__`, and against `strict_dataclass` with generated `__init__` and
+with checked `__setattr__`, each for regular and `__slots__` classes.
+Classes with `__slots__` are measured on Python 3.10 and newer only.
+"""
+import sys
+from argparse import ArgumentParser
+from dataclasses import dataclass
+from timeit import timeit
+from typing import Optional
+
+from strict_hint import strict, strict_dataclass
+
+
+SLOTS = (False, True) if sys.version_info >= (3, 10) else (False,)
+
+
+def define(slots: bool):
+    @dataclass(**({'slots': True} if slots else {}))
+    class Order:
+        id: int
+        name: str
+        price: float
+        note: Optional[str] = None
+
+    return Order
+
+
+def variants(slots: bool):
+    yield 'plain', define(slots)
+    yield 'strict', strict(define(slots))
+    yield 'strict fast', strict(fast=True)(define(slots))
+    yield 'strict_dataclass', strict_dataclass(define(slots))
+    yield 'setattr', strict_dataclass(define(slots), setattr=True)
+
+
+def measure(classes, number: int, repeat: int) -> list:
+    """Best rate of instances created per second, rounds are interleaved."""
+    best = [float('inf')] * len(classes)
+    for _ in range(repeat):
+        for i, cls in enumerate(classes):
+            best[i] = min(
+                best[i], timeit(lambda: cls(1, 'order', 9.99), number=number)
+            )
+
+    return [number / time for time in best]
+
+
+def main() -> None:
+    parser = ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--number', type=int, default=200000)
+    parser.add_argument('--repeat', type=int, default=5)
+    options = parser.parse_args()
+
+    print('%-26s %14s %8s' % ('variant', 'instances/s', 'ratio'))
+    for slots in SLOTS:
+        names, classes = zip(*variants(slots))
+        rates = measure(classes, options.number, options.repeat)
+        plain = rates[0]
+        for name, rate in zip(names, rates):
+            print('%-26s %14.0f %8.2f' % (
+                '%s%s' % (name, ' (slots)' if slots else ''),
+                rate, plain / rate
+            ))
+
+
+if __name__ == '__main__':
+    main()
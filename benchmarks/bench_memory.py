@@ -0,0 +1,62 @@
+"""Memory retained by `@strict` per decorated function.
+
+    PYTHONPATH=. python benchmarks/bench_memory.py [--count 100000]
+
+Decorates many distinct functions with the same signature, as done for
+methods like `(self, x: int) -> int`, and reports memory retained
+per function on top of undecorated ones.
+"""
+import gc
+import tracemalloc
+from argparse import ArgumentParser
+from types import FunctionType
+
+from strict_hint import strict
+
+
+def template(self, x: int) -> int:
+    return x
+
+
+def clone(index: int):
+    func = FunctionType(
+        template.__code__, template.__globals__, 'method_%d' % index
+    )
+    func.__annotations__ = dict(template.__annotations__)
+    func.__qualname__ = 'Class%d.method' % index
+    return func
+
+
+def measure(count: int, decorate) -> float:
+    gc.collect()
+    tracemalloc.start()
+    start = tracemalloc.get_traced_memory()[0]
+    functions = [decorate(clone(i)) for i in range(count)]
+    gc.collect()
+    used = tracemalloc.get_traced_memory()[0] - start
+    tracemalloc.stop()
+    del functions
+
+    return used / count
+
+
+def main() -> None:
+    parser = ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--count', type=int, default=100000)
+    options = parser.parse_args()
+
+    plain = measure(options.count, lambda func: func)
+    print('%d functions' % options.count)
+    print('%-10s %8.0f bytes/function' % ('plain', plain))
+    for name, decorate in (
+            ('generic', strict),
+            ('fast', strict(fast=True)),
+    ):
+        used = measure(options.count, decorate)
+        print('%-10s %8.0f bytes/function (+%.0f)' % (
+            name, used, used - plain
+        ))
+
+
+if __name__ == '__main__':
+    main()
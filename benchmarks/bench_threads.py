@@ -0,0 +1,70 @@
+"""Throughput of `@strict` function called from growing number of threads.
+
+    PYTHONPATH=. python benchmarks/bench_threads.py \
+        [--calls N] [--threads 1,2,4,8]
+
+On builds with GIL throughput is expected to stay flat, on free-threaded
+builds it should grow with threads, as checks share no mutable state.
+"""
+import sys
+from argparse import ArgumentParser
+from threading import Barrier, Thread
+from time import perf_counter
+
+from strict_hint import strict
+
+
+def plain(a, b):
+    return a
+
+
+@strict
+def generic(a: int, b: str) -> int:
+    return a
+
+
+@strict(fast=True)
+def fast(a: int, b: str) -> int:
+    return a
+
+
+def measure(func, threads: int, calls: int) -> float:
+    """Calls per second of all threads together."""
+    barrier = Barrier(threads + 1)
+
+    def work() -> None:
+        barrier.wait()
+        for i in range(calls):
+            func(i, 'b')
+
+    workers = [Thread(target=work) for _ in range(threads)]
+    for worker in workers:
+        worker.start()
+    start = perf_counter()
+    barrier.wait()
+    for worker in workers:
+        worker.join()
+
+    return threads * calls / (perf_counter() - start)
+
+
+def main() -> None:
+    parser = ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--calls', type=int, default=200000)
+    parser.add_argument('--threads', default='1,2,4,8')
+    options = parser.parse_args()
+
+    gil = getattr(sys, '_is_gil_enabled', lambda: True)()
+    print('GIL %s' % ('enabled' if gil else 'disabled'))
+    print('%-8s %s' % ('threads', ' '.join(
+        '%12s' % name for name in ('plain', 'generic', 'fast')
+    )))
+    for threads in map(int, options.threads.split(',')):
+        print('%-8d %s' % (threads, ' '.join(
+            '%10.0fk/s' % (measure(func, threads, options.calls) / 1000)
+            for func in (plain, generic, fast)
+        )))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,224 @@
+"""Per-call overhead of `@strict` against undecorated call, by hint kind.
+
+    PYTHONPATH=. python benchmarks/suite.py run [--output results.json]
+    PYTHONPATH=. python benchmarks/suite.py compare baseline.json results.json
+
+Results are stored as JSON, `compare` exits with non-zero status when
+overhead of any case grew beyond threshold and by more than `NOISE_NS`.
+Overhead is time of checked call less time of undecorated one, scaled
+by speed of undecorated calls, so results of slower and faster machines
+can be compared.
+"""
+import json
+import platform
+import sys
+from argparse import ArgumentParser
+from timeit import timeit
+from typing import (
+    Dict, List, NewType, Optional, Protocol, Tuple, Union, runtime_checkable
+)
+
+from strict_hint import strict
+
+UserId = NewType('UserId', int)
+
+THRESHOLD = 0.25
+NOISE_NS = 40
+REPEAT = 9
+
+
+@runtime_checkable
+class Closable(Protocol):
+    def close(self) -> None:
+        ...
+
+
+class Resource:
+    def close(self) -> None:
+        pass
+
+
+def primitives(a: int, b: str, c: float) -> int:
+    return a
+
+
+def tuple_of_types(a: (int, str), b: (float, int)) -> (int, str):
+    return a
+
+
+def list_of(a: [int]) -> [int]:
+    return a
+
+
+def typing_generics(a: List[int], b: Dict[str, int]) -> Tuple[int, str]:
+    return 1, 'a'
+
+
+def new_type(a: UserId) -> UserId:
+    return a
+
+
+def optional_union(a: Optional[str], b: Union[int, str]) -> Optional[int]:
+    return None
+
+
+def protocol(a: Closable) -> Closable:
+    return a
+
+
+def defaults(a: int, b: int = None, c: str = '') -> int:
+    return a
+
+
+def error_path(a: int) -> int:
+    return a
+
+
+CASES = (
+    ('primitives', primitives, (1, 'b', 1.0), {}),
+    ('tuple of types', tuple_of_types, (1, 1.0), {}),
+    ('[int]', list_of, ([1],), {}),
+    ('typing generics', typing_generics, ([1], {'a': 1}), {}),
+    ('NewType', new_type, (UserId(1),), {}),
+    ('Optional/Union', optional_union, (None, 'b'), {}),
+    ('Protocol', protocol, (Resource(),), {}),
+    ('defaults', defaults, (1,), {}),
+    ('positional', primitives, (1, 'b', 1.0), {}),
+    ('kwargs', primitives, (), {'a': 1, 'b': 'b', 'c': 1.0}),
+    ('error path', error_path, ('a',), {}),
+)
+
+VARIANTS = (
+    ('generic', {}),
+    ('fast', {'fast': True}),
+)
+
+
+def caller(func, args: tuple, kwargs: dict):
+    def call():
+        try:
+            func(*args, **kwargs)
+        except TypeError:
+            pass
+
+    return call
+
+
+def measure(funcs, args: tuple, kwargs: dict, number: int, times: int):
+    """Best time per call in ns, rounds of all funcs are interleaved."""
+    callers = [caller(func, args, kwargs) for func in funcs]
+    best = [float('inf')] * len(funcs)
+    for _ in range(times):
+        for i, call in enumerate(callers):
+            best[i] = min(best[i], timeit(call, number=number))
+
+    return [ns / number * 1e9 for ns in best]
+
+
+def run(number: int, times: int) -> dict:
+    results = {}
+    for name, func, args, kwargs in CASES:
+        funcs = [func] + [strict(**opts)(func) for _, opts in VARIANTS]
+        plain, *checked = measure(funcs, args, kwargs, number, times)
+        for (variant, _), ns in zip(VARIANTS, checked):
+            results['%s/%s' % (variant, name)] = {
+                'plain_ns': round(plain, 1),
+                'strict_ns': round(ns, 1),
+                'ratio': round(ns / plain, 3),
+            }
+
+    return {
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'number': number,
+        'cases': results,
+    }
+
+
+def compare(
+        baseline: dict, current: dict, threshold: float,
+        noise: float = NOISE_NS
+) -> list:
+    """Lists cases which overhead grew by more than threshold and noise."""
+    regressions = []
+    for case, base in sorted(baseline['cases'].items()):
+        now = current['cases'].get(case)
+        if now is None:
+            continue
+
+        before = base['strict_ns'] - base['plain_ns']
+        after = (now['strict_ns'] - now['plain_ns']) \
+            * base['plain_ns'] / now['plain_ns']
+        if after - before > max(threshold * before, noise):
+            change = after / before - 1 if before > 0 else float('inf')
+            regressions.append((case, before, after, change))
+
+    return regressions
+
+
+def print_results(results: dict) -> None:
+    print('%-26s %10s %10s %8s' % ('case', 'plain ns', 'strict ns', 'ratio'))
+    for case, row in results['cases'].items():
+        print('%-26s %10.0f %10.0f %8.2f' % (
+            case, row['plain_ns'], row['strict_ns'], row['ratio']
+        ))
+
+
+def main(argv=None) -> int:
+    parser = ArgumentParser(description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest='command')
+    commands.required = True
+
+    run_parser = commands.add_parser('run', help='measure and store results')
+    run_parser.add_argument('--output', help='JSON file to write results to')
+    run_parser.add_argument('--number', type=int, default=100000)
+    run_parser.add_argument('--repeat', type=int, default=REPEAT)
+
+    compare_parser = commands.add_parser(
+        'compare', help='flag regressions against baseline'
+    )
+    compare_parser.add_argument('baseline')
+    compare_parser.add_argument(
+        'current', nargs='?', help='results to compare, measured if omitted'
+    )
+    compare_parser.add_argument('--threshold', type=float, default=THRESHOLD)
+    compare_parser.add_argument(
+        '--noise', type=float, default=NOISE_NS,
+        help='smallest growth of overhead in ns reported'
+    )
+    compare_parser.add_argument('--number', type=int, default=100000)
+    compare_parser.add_argument('--repeat', type=int, default=REPEAT)
+
+    options = parser.parse_args(argv)
+
+    if options.command == 'run':
+        results = run(options.number, options.repeat)
+        print_results(results)
+        if options.output:
+            with open(options.output, 'w') as handle:
+                json.dump(results, handle, indent=2, sort_keys=True)
+        return 0
+
+    with open(options.baseline) as handle:
+        baseline = json.load(handle)
+
+    if options.current:
+        with open(options.current) as handle:
+            current = json.load(handle)
+    else:
+        current = run(options.number, options.repeat)
+        print_results(current)
+
+    regressions = compare(
+        baseline, current, options.threshold, options.noise
+    )
+    for case, before, after, change in regressions:
+        print('REGRESSION %-26s overhead %.0f -> %.0f ns (+%.0f%%)' % (
+            case, before, after, change * 100
+        ))
+
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
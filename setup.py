@@ -1,6 +1,4 @@
-from distutils.core import setup
-
-from setuptools import find_packages
+from setuptools import find_packages, setup
 
 with open('README.rst') as readme_file:
     readme = readme_file.read()
@@ -23,6 +21,7 @@ setup(
         'argument type',
         'return type'
     ],
+    python_requires='>=3.9',
     test_suite='tests',
     tests_require=[
         'pytest',
@@ -31,8 +30,11 @@ setup(
     classifiers=[
         'Intended Audience :: Developers',
         'Operating System :: OS Independent',
-        'Programming Language :: Python :: 3.5',
-        'Programming Language :: Python :: 3.6',
+        'Programming Language :: Python :: 3.9',
+        'Programming Language :: Python :: 3.10',
+        'Programming Language :: Python :: 3.11',
+        'Programming Language :: Python :: 3.12',
+        'Programming Language :: Python :: 3.13',
         'License :: OSI Approved :: MIT License',
     ],
 )
@@ -1,5 +1,14 @@
-from strict_hint.strict_hint import StrictHint
+from strict_hint.batch import check_batch, Violation  # noqa: F401
+from strict_hint.fields import strict_dataclass  # noqa: F401
+from strict_hint.instrument import (  # noqa: F401
+    enable_stats, stats, reset_stats
+)
+from strict_hint.policy import set_mode, get_mode  # noqa: F401
+from strict_hint.strict_hint import StrictHint, warm  # noqa: F401
 
 
-def strict(wrapped):
-    return StrictHint()(wrapped)
+def strict(wrapped=None, **options):
+    if wrapped is None:
+        return StrictHint(**options)
+
+    return StrictHint(**options)(wrapped)
@@ -0,0 +1,110 @@
+"""Hints for `numpy.ndarray`, checked from array metadata only.
+
+This module imports NumPy, so it is not imported by the rest of package.
+"""
+import numpy
+
+from strict_hint.hints import Hint
+
+ABSTRACT_DTYPES = (
+    numpy.generic, numpy.number, numpy.integer, numpy.signedinteger,
+    numpy.unsignedinteger, numpy.inexact, numpy.floating,
+    numpy.complexfloating, numpy.flexible, numpy.character,
+)
+
+
+class Array(Hint):
+    """Hint for `numpy.ndarray` with optional dtype, ndim and shape.
+
+    Shape items are either fixed sizes, `None` for any size, or names of
+    symbolic dimensions. Symbolic dimension must have the same size in all
+    arguments of a single call, eg. `N` in both `x` and `y`:
+
+        @strict
+        def dot(x: Array(float, shape=('N',)), y: Array(shape=('N',))):
+            ...
+
+    Checks cost O(ndim) and never iterate array elements. Abstract dtypes,
+    such as `numpy.floating`, accept all of their concrete dtypes.
+    """
+
+    __slots__ = ('dtype', 'kind', 'ndim', 'shape', 'fixed', 'symbols')
+
+    by_type = False
+
+    def __init__(
+            self, dtype=None, ndim: int = None, shape: tuple = None
+    ) -> None:
+        super().__init__(self, numpy.ndarray)
+        self.dtype = None
+        self.kind = None
+        self.ndim = ndim
+        self.shape = shape
+        self.fixed = ()
+        self.symbols = ()
+
+        if isinstance(dtype, type) and dtype in ABSTRACT_DTYPES:
+            self.kind = dtype
+        elif dtype is not None:
+            self.dtype = numpy.dtype(dtype)
+
+        if shape is not None:
+            shape = tuple(shape)
+            if ndim is not None and ndim != len(shape):
+                raise ValueError(
+                    'Shape %s does not have %s dimensions' % (shape, ndim)
+                )
+            self.ndim = len(shape)
+            self.fixed = tuple(
+                (axis, size) for axis, size in enumerate(shape)
+                if isinstance(size, int)
+            )
+            self.symbols = tuple(
+                (axis, size) for axis, size in enumerate(shape)
+                if isinstance(size, str)
+            )
+
+    def matches(self, value) -> bool:
+        if not isinstance(value, numpy.ndarray):
+            return False
+
+        if self.dtype is not None and value.dtype != self.dtype:
+            return False
+
+        if self.kind is not None and not issubclass(
+                value.dtype.type, self.kind
+        ):
+            return False
+
+        if self.ndim is not None and value.ndim != self.ndim:
+            return False
+
+        shape = value.shape
+        for axis, size in self.fixed:
+            if shape[axis] != size:
+                return False
+
+        if len(self.symbols) > 1:
+            sizes = {}
+            for axis, symbol in self.symbols:
+                if sizes.setdefault(symbol, shape[axis]) != shape[axis]:
+                    return False
+
+        return True
+
+    def bind(self, value):
+        shape = value.shape
+        return ((symbol, shape[axis]) for axis, symbol in self.symbols)
+
+    def __repr__(self) -> str:
+        spec = []
+        if self.dtype is not None or self.kind is not None:
+            spec.append('dtype=%s' % (self.dtype or self.kind.__name__))
+        if self.shape is not None:
+            spec.append('shape=(%s)' % ', '.join(
+                'None' if size is None else str(size) for size in self.shape
+            ))
+        elif self.ndim is not None:
+            spec.append('ndim=%s' % self.ndim)
+
+        return 'Array(%s)' % ', '.join(spec)
@@ -0,0 +1,126 @@
+from collections import namedtuple
+
+from strict_hint.errors import ArgumentTypeHintError
+from strict_hint.strict_hint import Plan
+
+
+class Violation(namedtuple(
+    'Violation',
+    ('row', 'argument_name', 'func_name', 'expected_type', 'given_type')
+)):
+    """Invalid argument in single row, message is built only on demand."""
+
+    __slots__ = ()
+
+    def error(self) -> ArgumentTypeHintError:
+        return ArgumentTypeHintError(
+            self.argument_name, self.func_name,
+            self.expected_type, self.given_type
+        )
+
+    def __str__(self) -> str:
+        return str(self.error())
+
+
+def check_batch(func, rows) -> list:
+    """Checks argument rows against plan of func, returns all violations.
+
+    Rows are tuples of positional arguments or dicts of keyword arguments.
+    Rows are grouped by classes of their arguments, hints that decide on
+    class alone are evaluated once per distinct combination of classes.
+    Violations are listed in row order, no exception is raised.
+    """
+    resolve = getattr(func, '__strict_resolve__', None)
+    if resolve is not None:
+        resolve()
+    plan = getattr(func, '__strict_plan__', None) or Plan(func)
+    typed = [
+        (position, check) for position, check in enumerate(plan.positional)
+        if check is not None and check.hint.by_type
+    ]
+    valued = [
+        (position, check) for position, check in enumerate(plan.positional)
+        if check is not None and not check.hint.by_type
+    ]
+    decisions = {}
+    violations = []
+
+    for index, row in enumerate(rows):
+        if isinstance(row, dict):
+            violations.extend(_check_keywords(plan, index, row, decisions))
+            continue
+
+        key = tuple(map(type, row))
+        failed = decisions.get(key)
+        if failed is None:
+            failed = decisions[key] = tuple(
+                (position, check) for position, check in typed
+                if position < len(row) and not check.matches(row[position])
+            )
+
+        for position, check in failed:
+            violation = _violation(plan, index, check, row[position])
+            if violation is not None:
+                violations.append(violation)
+
+        for position, check in valued:
+            if position < len(row) and not check.matches(row[position]):
+                violation = _violation(plan, index, check, row[position])
+                if violation is not None:
+                    violations.append(violation)
+
+        arity = plan.layout.arity
+        if plan.variadic is not None and len(row) > arity:
+            violations.extend(
+                _from_error(index, error)
+                for error in plan.variadic_violations(row[arity:])
+            )
+
+    return violations
+
+
+def _check_keywords(plan, index: int, row: dict, decisions: dict):
+    keywords = plan.keywords
+    key = tuple((name, type(value)) for name, value in row.items())
+    failed = decisions.get(key)
+    if failed is None:
+        failed = decisions[key] = tuple(
+            name for name, value in row.items()
+            if name in keywords and keywords[name].hint.by_type
+            and not keywords[name].matches(value)
+        )
+
+    for name, value in row.items():
+        check = keywords.get(name)
+        if check is None:
+            continue
+
+        if check.hint.by_type and name not in failed:
+            continue
+
+        if not check.hint.by_type and check.matches(value):
+            continue
+
+        violation = _violation(plan, index, check, value)
+        if violation is not None:
+            yield violation
+
+    if plan.extra is not None:
+        for error in plan.extra_violations(row):
+            yield _from_error(index, error)
+
+
+def _from_error(index: int, error) -> Violation:
+    return Violation(
+        index, error.argument_name, error.func_name, error.expected_type,
+        error.given_type
+    )
+
+
+def _violation(plan, index: int, check, value) -> Violation:
+    if check.is_default(value):
+        return None
+
+    return Violation(
+        index, check.name, plan.func_name, check.hint.annotation, type(value)
+    )
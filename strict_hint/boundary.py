@@ -0,0 +1,59 @@
+"""Checking only calls entering a scope from outside of it.
+
+Scope of boundary call is stored in a context variable for its duration,
+so nested calls of the same scope skip their checks and call decorated
+function directly. Context variables are local to thread and task, no
+frames are inspected.
+"""
+from contextvars import ContextVar
+from functools import wraps
+
+entered = ContextVar('strict_hint_entered', default=None)
+
+
+def is_inside(scope) -> bool:
+    """Tells if call of scope is nested in boundary call of that scope.
+
+    Scope `True` is nested in any boundary call, named scope, eg. a
+    package, only in boundary call of the same name.
+    """
+    current = entered.get()
+    if current is None:
+        return False
+
+    return scope is True or current == scope
+
+
+def guard(func, checked, scope):
+    """Calls checked wrapper on boundary of scope, func inside of it."""
+    get = entered.get
+    anywhere = scope is True
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        current = get()
+        if current is not None and (anywhere or current == scope):
+            return func(*args, **kwargs)
+
+        token = entered.set(scope)
+        try:
+            return checked(*args, **kwargs)
+        finally:
+            entered.reset(token)
+
+    return wrapper
+
+
+def guard_coroutine(func, checked, scope):
+    @wraps(func)
+    async def wrapper(*args, **kwargs):
+        if is_inside(scope):
+            return await func(*args, **kwargs)
+
+        token = entered.set(scope)
+        try:
+            return await checked(*args, **kwargs)
+        finally:
+            entered.reset(token)
+
+    return wrapper
@@ -0,0 +1,313 @@
+from dataclasses import MISSING, fields
+from functools import lru_cache
+from inspect import Parameter
+
+from strict_hint.hints import Hint
+from strict_hint.policy import OFF, RAISE
+
+PREFIX = '_strict_'
+FACTORIES = 1024
+VARIADIC = (Parameter.VAR_POSITIONAL, Parameter.VAR_KEYWORD)
+
+
+def generate_wrapper(func, sig, plan, policy):
+    """Generates wrapper with exact signature of decorated function.
+
+    Each annotated parameter becomes an inline `isinstance` check against
+    types bound as closure constants, parameters without annotation produce
+    no code at all. Returns `None` when signature can not be reproduced,
+    in which case generic wrapper should be used instead.
+    """
+    if any(name.startswith(PREFIX) for name in sig.parameters):
+        return None
+
+    consts = {
+        PREFIX + 'func': func,
+        PREFIX + 'name': plan.func_name,
+        PREFIX + 'plan': plan,
+        PREFIX + 'policy': policy,
+        PREFIX + 'RAISE': RAISE,
+    }
+    params, call, args, kwargs, defaults = _reproduce(sig, consts)
+    packed = _packed(args, kwargs)
+    body = _dispatch(packed) + _checks(sig, plan, defaults, consts)
+    if plan.constraints:
+        body.append(
+            '    %splan.check_constraints(%s)' % (PREFIX, packed)
+        )
+    body.append('    result = %sfunc(%s)' % (PREFIX, ', '.join(call)))
+    returns = plan.returns
+    if returns is not None and returns.lazy:
+        body.append('    return %splan.check_return(result)' % PREFIX)
+    else:
+        if returns is not None:
+            condition = _condition('result', returns, 'r', consts)
+            body.append('    if result is not None and %s:' % condition)
+            body.append('        %splan.check_return(result)' % PREFIX)
+        body.append('    return result')
+
+    return _build(params, body, consts)
+
+
+def generate_init(cls, init, sig, plan, policy):
+    """Generates `__init__` of dataclass, checking and assigning fields.
+
+    Replaces `__init__` generated by `dataclass` for this very class, which
+    caller must make sure of. Fields are assigned directly, instead of
+    calling it, in modes other than `raise` original one is called. Returns
+    `None` for signatures that can not be reproduced.
+    """
+    if any(name.startswith(PREFIX) for name in sig.parameters):
+        return None
+
+    consts = {
+        PREFIX + 'func': init,
+        PREFIX + 'name': plan.func_name,
+        PREFIX + 'plan': plan,
+        PREFIX + 'policy': policy,
+        PREFIX + 'RAISE': RAISE,
+        PREFIX + 'set': object.__setattr__,
+    }
+    params, call, args, kwargs, defaults = _reproduce(sig, consts)
+    packed = _packed(args, kwargs)
+    body = _dispatch(packed) + _checks(sig, plan, defaults, consts)
+    if plan.constraints:
+        body.append(
+            '    %splan.check_constraints(%s)' % (PREFIX, packed)
+        )
+
+    names = list(sig.parameters)
+    instance = names[0]
+    frozen = cls.__dataclass_params__.frozen
+    assigned = set()
+    for index, field in enumerate(fields(cls)):
+        assigned.add(field.name)
+        factory = '%sf%d' % (PREFIX, index)
+        if field.default_factory is not MISSING:
+            consts[factory] = field.default_factory
+
+        if field.init and field.default_factory is not MISSING:
+            value = '%s() if %s is %s else %s' % (
+                factory, field.name,
+                defaults[names.index(field.name)], field.name
+            )
+        elif field.init:
+            value = field.name
+        elif field.default is not MISSING:
+            value = '%sv%d' % (PREFIX, index)
+            consts[value] = field.default
+        elif field.default_factory is not MISSING:
+            value = factory + '()'
+        else:
+            continue
+
+        if frozen:
+            body.append('    %sset(%s, %r, %s)' % (
+                PREFIX, instance, field.name, value
+            ))
+        else:
+            body.append('    %s.%s = %s' % (instance, field.name, value))
+
+    if hasattr(cls, '__post_init__'):
+        body.append('    %s.__post_init__(%s)' % (instance, ', '.join(
+            name for name in names[1:] if name not in assigned
+        )))
+
+    return _build(params, body, consts)
+
+
+def generate_deferred(func, sig, plan, policy, collector):
+    """Generates deferred wrapper with exact signature of decorated function.
+
+    Classes of arguments are taken one by one, without iterating packed
+    arguments. Returns `None` when signature can not be reproduced.
+    """
+    if any(name.startswith(PREFIX) for name in sig.parameters):
+        return None
+
+    consts = {
+        PREFIX + 'func': func,
+        PREFIX + 'plan': plan,
+        PREFIX + 'policy': policy,
+        PREFIX + 'OFF': OFF,
+        PREFIX + 'buffer': collector.buffer,
+        PREFIX + 'size': collector.size,
+        PREFIX + 'ticks': collector.ticks,
+        PREFIX + 'type': type,
+        PREFIX + 'next': next,
+        PREFIX + 'map': map,
+    }
+    params, call, args, kwargs, defaults = _reproduce(sig, consts)
+
+    types = []
+    keyword_types = []
+    for param in sig.parameters.values():
+        name = param.name
+        if param.kind is Parameter.VAR_POSITIONAL:
+            types.append('*%smap(%stype, %s)' % (PREFIX, PREFIX, name))
+        elif param.kind is Parameter.VAR_KEYWORD:
+            keyword_types.append(
+                '*((k, %stype(v)) for k, v in %s.items())' % (PREFIX, name)
+            )
+        elif param.kind is Parameter.KEYWORD_ONLY:
+            keyword_types.append('(%r, %stype(%s))' % (name, PREFIX, name))
+        else:
+            types.append('%stype(%s)' % (PREFIX, name))
+
+    body = [
+        '    %sresult = %sfunc(%s)' % (PREFIX, PREFIX, ', '.join(call)),
+        '    if %spolicy.mode is not %sOFF:' % (PREFIX, PREFIX),
+        '        %sbuffer[%snext(%sticks) %% %ssize] = (' % (
+            PREFIX, PREFIX, PREFIX, PREFIX
+        ),
+        '            %splan, (%s), (%s), %stype(%sresult)' % (
+            PREFIX,
+            ''.join(item + ', ' for item in types),
+            ''.join(item + ', ' for item in keyword_types),
+            PREFIX, PREFIX
+        ),
+        '        )',
+        '    return %sresult' % PREFIX,
+    ]
+
+    return _build(params, body, consts)
+
+
+def _packed(args: list, kwargs: list) -> str:
+    """Expression packing arguments as `args, kwargs` of generic call."""
+    return '(%s), {%s}' % (
+        ''.join(arg + ', ' for arg in args), ', '.join(kwargs)
+    )
+
+
+def _dispatch(packed: str) -> list:
+    return [
+        '    if %spolicy.mode is not %sRAISE:' % (PREFIX, PREFIX),
+        '        return %spolicy.dispatch(%splan, %sfunc, %s)' % (
+            PREFIX, PREFIX, PREFIX, packed
+        ),
+    ]
+
+
+def _checks(sig, plan, defaults: dict, consts: dict) -> list:
+    """Inline checks of annotated parameters, skipped for defaults."""
+    body = []
+    for index, param in enumerate(sig.parameters.values()):
+        if param.annotation is param.empty:
+            continue
+
+        name = param.name
+        if param.kind in VARIADIC:
+            method = 'check_variadic'
+            if param.kind is Parameter.VAR_KEYWORD:
+                method = 'check_extra'
+            body.append('    if %s:' % name)
+            body.append('        %splan.%s(%s)' % (PREFIX, method, name))
+            continue
+
+        check = plan.keywords.get(name) or plan.positional[index]
+        condition = _condition(name, check.hint, index, consts)
+        default = defaults.get(index)
+        if default is not None:
+            condition = '%s is not %s and %s' % (name, default, condition)
+
+        const = '%sc%d' % (PREFIX, index)
+        consts[const] = check
+        body.append('    if %s:' % condition)
+        body.append('        %s.reject(%s, %sname)' % (const, name, PREFIX))
+
+    return body
+
+
+def _reproduce(sig, consts: dict) -> tuple:
+    """Builds parameters and arguments reproducing signature.
+
+    Returns parameters of wrapper, arguments calling decorated function,
+    items of packed positional and keyword arguments and names of consts
+    holding defaults, by index of parameter.
+    """
+    params = []
+    call = []
+    args = []
+    kwargs = []
+    defaults = {}
+    positional_only = False
+    keyword_only = False
+
+    for index, param in enumerate(sig.parameters.values()):
+        name = param.name
+        kind = param.kind
+
+        if kind is Parameter.POSITIONAL_ONLY:
+            positional_only = True
+        elif positional_only:
+            params.append('/')
+            positional_only = False
+
+        if kind is Parameter.VAR_POSITIONAL:
+            params.append('*' + name)
+            call.append('*' + name)
+            args.append('*' + name)
+            keyword_only = True
+            continue
+
+        if kind is Parameter.VAR_KEYWORD:
+            params.append('**' + name)
+            call.append('**' + name)
+            kwargs.append('**' + name)
+            continue
+
+        if kind is Parameter.KEYWORD_ONLY:
+            if not keyword_only:
+                params.append('*')
+                keyword_only = True
+            call.append('%s=%s' % (name, name))
+            kwargs.append('%r: %s' % (name, name))
+        else:
+            call.append(name)
+            args.append(name)
+
+        if param.default is param.empty:
+            params.append(name)
+        else:
+            default = '%sd%d' % (PREFIX, index)
+            consts[default] = param.default
+            defaults[index] = default
+            params.append('%s=%s' % (name, default))
+
+    if positional_only:
+        params.append('/')
+
+    return params, call, args, kwargs, defaults
+
+
+def _build(params: list, body: list, consts: dict):
+    source = '\n'.join([
+        'def %smake(%s):' % (PREFIX, ', '.join(consts)),
+        '  def wrapper(%s):' % ', '.join(params),
+        '\n'.join('  ' + line for line in body),
+        '  return wrapper',
+    ])
+
+    return factory(source)(**consts)
+
+
+@lru_cache(maxsize=FACTORIES)
+def factory(source: str):
+    """Compiles wrapper factory, shared by functions with same signature."""
+    namespace = {}
+    exec(compile(source, '<strict>', 'exec'), namespace)
+
+    return namespace[PREFIX + 'make']
+
+
+def _condition(name: str, hint, key, consts: dict) -> str:
+    if type(hint) is Hint:
+        types = '%st%s' % (PREFIX, key)
+        consts[types] = hint.types
+        consts[PREFIX + 'isinstance'] = isinstance
+        return 'not %sisinstance(%s, %s)' % (PREFIX, name, types)
+
+    matches = '%sm%s' % (PREFIX, key)
+    consts[matches] = hint.matches
+    return 'not %s(%s)' % (matches, name)
@@ -0,0 +1,159 @@
+"""Checking calls in background, from classes of their values.
+
+Deferred wrapper only records classes of arguments and returned value of
+each call in a ring buffer and returns. Background thread drains buffer
+every `interval` seconds, checks each distinct record once and reports
+violations to a callback, by default as `TypeHintWarning`.
+"""
+from functools import wraps
+from itertools import count
+from threading import Event, Lock, Thread
+from traceback import print_exc
+from warnings import warn
+
+from strict_hint.errors import TypeHintWarning
+from strict_hint.policy import OFF
+
+BUFFER_SIZE = 4096
+INTERVAL = 1.0
+SEEN_SIZE = 65536
+
+
+def report(error) -> None:
+    warn(str(error), TypeHintWarning)
+
+
+class Collector(object):
+    """Ring buffer of recorded calls and thread checking them.
+
+    Slots are claimed with `itertools.count`, which is advanced atomically,
+    so recording takes no lock. When calls are recorded faster than
+    they are drained, oldest records are overwritten and never checked.
+    Records already checked are remembered, up to `SEEN_SIZE` of them.
+    Exceptions raised by callback are printed, so that they neither stop
+    the thread nor prevent reporting other errors.
+    """
+
+    def __init__(
+            self, size: int = BUFFER_SIZE, interval: float = INTERVAL,
+            callback=report
+    ) -> None:
+        self.size = size
+        self.interval = interval
+        self.callback = callback
+        self.buffer = [None] * size
+        self.ticks = count()
+        self.seen = set()
+        self.lock = Lock()
+        self.stopped = Event()
+        self.thread = None
+
+    def start(self) -> None:
+        """Starts draining thread, unless it already runs."""
+        with self.lock:
+            if self.thread is not None and self.thread.is_alive():
+                return
+
+            self.stopped.clear()
+            self.thread = Thread(
+                target=self.__run, name='strict-hint-deferred', daemon=True
+            )
+            self.thread.start()
+
+    def stop(self) -> None:
+        """Stops draining thread, after it drains buffer once more."""
+        self.stopped.set()
+        thread = self.thread
+        if thread is not None:
+            thread.join()
+
+    def drain(self) -> list:
+        """Checks records not checked yet, returns reported errors."""
+        with self.lock:
+            buffer = self.buffer
+            records = []
+            for index, record in enumerate(buffer):
+                if record is not None:
+                    buffer[index] = None
+                    records.append(record)
+
+            errors = []
+            seen = self.seen
+            for record in records:
+                if record in seen:
+                    continue
+                if len(seen) >= SEEN_SIZE:
+                    seen.clear()
+                seen.add(record)
+
+                plan, types, keyword_types, result_type = record
+                errors.extend(
+                    plan.type_violations(types, keyword_types, result_type)
+                )
+
+        for error in errors:
+            try:
+                self.callback(error)
+            except Exception:
+                print_exc()
+
+        return errors
+
+    def __run(self) -> None:
+        while not self.stopped.wait(self.interval):
+            self.drain()
+        self.drain()
+
+
+collector = Collector()
+
+
+def set_reporter(callback) -> None:
+    """Sets function called with each error found in background."""
+    collector.callback = callback
+
+
+def deferred(func, plan, policy, collector: Collector = collector):
+    """Wrapper recording classes of arguments and result of each call."""
+    buffer = collector.buffer
+    size = collector.size
+    ticks = collector.ticks
+    collector.start()
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        result = func(*args, **kwargs)
+        if policy.mode is not OFF:
+            buffer[next(ticks) % size] = (
+                plan, tuple(map(type, args)),
+                tuple((name, type(value)) for name, value in kwargs.items())
+                if kwargs else (),
+                type(result)
+            )
+
+        return result
+
+    return wrapper
+
+
+def deferred_coroutine(func, plan, policy, collector: Collector = collector):
+    """Same as `deferred`, result is recorded once awaited."""
+    buffer = collector.buffer
+    size = collector.size
+    ticks = collector.ticks
+    collector.start()
+
+    @wraps(func)
+    async def wrapper(*args, **kwargs):
+        result = await func(*args, **kwargs)
+        if policy.mode is not OFF:
+            buffer[next(ticks) % size] = (
+                plan, tuple(map(type, args)),
+                tuple((name, type(value)) for name, value in kwargs.items())
+                if kwargs else (),
+                type(result)
+            )
+
+        return result
+
+    return wrapper
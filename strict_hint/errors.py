@@ -0,0 +1,111 @@
+def field(index: int, doc: str) -> property:
+    return property(lambda self: self.args[index], doc=doc)
+
+
+class TypeHintError(TypeError):
+    """Base of all check failures.
+
+    Failures carry structured fields, kept in `args`, message is formatted
+    only when error is converted to string.
+    """
+
+
+class ArgumentTypeHintError(TypeHintError):
+    def __init__(
+            self, argument_name, func_name, expected_type, given_type,
+            position=None
+    ) -> None:
+        super().__init__(
+            argument_name, func_name, expected_type, given_type, position
+        )
+
+    argument_name = field(0, 'Name of parameter.')
+    func_name = field(1, 'Name of function.')
+    expected_type = field(2, 'Annotation of parameter.')
+    given_type = field(3, 'Class of passed value.')
+    position = field(4, 'Index of positional parameter, `None` if keyword.')
+
+    def __str__(self) -> str:
+        return (
+            'Argument %s passed to %s must be an instance of %s, %s given'
+        ) % (
+            self.argument_name, self.func_name,
+            self.expected_type, self.given_type
+        )
+
+
+class ArgumentsTypeHintError(ArgumentTypeHintError):
+    """All invalid arguments of single call, fields are of the first one."""
+
+    def __init__(self, errors) -> None:
+        first = errors[0]
+        super().__init__(*first.args)
+        self.errors = errors
+
+    def __str__(self) -> str:
+        return '; '.join(str(error) for error in self.errors)
+
+    def __reduce__(self):
+        return type(self), (self.errors,)
+
+
+class DimensionHintError(ArgumentTypeHintError):
+    def __init__(
+            self, argument_name, func_name, symbol, expected_size, given_size
+    ) -> None:
+        TypeHintError.__init__(
+            self, argument_name, func_name, symbol, expected_size, given_size
+        )
+
+    symbol = field(2, 'Name of dimension.')
+    expected_size = field(3, 'Size bound by preceding arguments.')
+    given_size = field(4, 'Size in this argument.')
+    expected_type = None
+    given_type = None
+    position = None
+
+    def __str__(self) -> str:
+        return (
+            'Dimension %s of argument %s passed to %s must be %s, %s given'
+        ) % (
+            self.symbol, self.argument_name, self.func_name,
+            self.expected_size, self.given_size
+        )
+
+
+class ReturnValueTypeHintError(TypeHintError):
+    def __init__(
+            self, func_name, expected_type, given_type
+    ) -> None:
+        super().__init__(func_name, expected_type, given_type)
+
+    func_name = field(0, 'Name of function.')
+    expected_type = field(1, 'Return annotation.')
+    given_type = field(2, 'Class of returned value.')
+
+    def __str__(self) -> str:
+        return (
+            "Value returned by %s must be an instance of %s, %s returned"
+        ) % (
+            self.func_name, self.expected_type, self.given_type
+        )
+
+
+class YieldValueTypeHintError(TypeHintError):
+    def __init__(
+            self, func_name, expected_type, given_type
+    ) -> None:
+        super().__init__(func_name, expected_type, given_type)
+
+    func_name = field(0, 'Name of function.')
+    expected_type = field(1, 'Annotation of yielded items.')
+    given_type = field(2, 'Class of yielded value.')
+
+    def __str__(self) -> str:
+        return "Value yielded by %s must be an instance of %s, %s yielded" % (
+            self.func_name, self.expected_type, self.given_type
+        )
+
+
+class TypeHintWarning(UserWarning):
+    pass
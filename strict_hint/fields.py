@@ -0,0 +1,155 @@
+"""Checking fields of dataclasses with generated methods.
+
+`strict_dataclass` replaces `__init__` of a dataclass with one generated
+for its exact signature, with field checks and assignments inlined, so
+creating an instance packs no arguments and inspects nothing. With
+`setattr`, checks run on every assignment instead, also after
+construction.
+"""
+from dataclasses import MISSING, InitVar, fields, is_dataclass
+from functools import wraps
+from inspect import Parameter, signature
+from typing import get_type_hints
+from warnings import warn
+
+from strict_hint.codegen import generate_init, generate_wrapper
+from strict_hint.errors import TypeHintWarning
+from strict_hint.hints import Strategy, SHALLOW, DEFAULT_K
+from strict_hint.policy import OFF, RAISE, policy
+from strict_hint.strict_hint import ParamCheck, Plan, func_name
+
+
+def strict_dataclass(
+        cls=None, *, setattr: bool = False, strategy: str = SHALLOW,
+        k: int = DEFAULT_K
+):
+    """Checks fields of dataclass, decorated with `@dataclass` before.
+
+    Works for classes with `__slots__` and frozen ones, `setattr` can not
+    be used with the latter. Checks are enforced according to global
+    policy, see `set_mode`.
+    """
+    def decorate(cls):
+        if not is_dataclass(cls):
+            raise TypeError('%s is not a dataclass' % cls.__qualname__)
+
+        hints = resolve_hints(cls)
+        if setattr:
+            if cls.__dataclass_params__.frozen:
+                raise TypeError(
+                    'Frozen dataclass %s can not check assignments'
+                    % cls.__qualname__
+                )
+            cls.__setattr__ = checked_setattr(
+                cls, hints, Strategy(strategy, k)
+            )
+        else:
+            cls.__init__ = checked_init(cls, hints, Strategy(strategy, k))
+
+        return cls
+
+    if cls is None:
+        return decorate
+
+    return decorate(cls)
+
+
+def resolve_hints(cls) -> dict:
+    """Returns type of each field, with string annotations evaluated."""
+    hints = get_type_hints(cls, localns={cls.__name__: cls})
+    for name, hint in hints.items():
+        if isinstance(hint, InitVar):
+            hints[name] = hint.type
+
+    return hints
+
+
+GENERATED_INIT = '__create_fn__.<locals>.__init__'
+
+
+def is_generated_init(cls) -> bool:
+    """Tells if `__init__` of class was generated by `dataclass` for it.
+
+    Generated ones are created inside `__create_fn__`, which their code
+    tells since Python 3.11 and their name before 3.10. On Python 3.10
+    `False` is returned.
+    """
+    init = vars(cls).get('__init__')
+    code = getattr(init, '__code__', None)
+    if not cls.__dataclass_params__.init or code is None:
+        return False
+
+    qualname = getattr(code, 'co_qualname', init.__qualname__)
+    return qualname == GENERATED_INIT
+
+
+def checked_init(cls, hints: dict, strategy: Strategy):
+    """Generates `__init__` checking arguments and assigning fields.
+
+    Falls back to calling original `__init__` after checks, when it was not
+    generated by `dataclass` for this class, eg. it is inherited or custom.
+    """
+    init = cls.__init__
+    sig = signature(init)
+    sig = sig.replace(
+        parameters=[
+            param.replace(annotation=hints.get(name, param.empty))
+            for name, param in sig.parameters.items()
+        ],
+        return_annotation=sig.empty
+    )
+    plan = Plan(init, sig, strategy)
+    plan.func_name = '%s.__init__' % func_name(cls)
+
+    wrapper = None
+    if is_generated_init(cls):
+        wrapper = generate_init(cls, init, sig, plan, policy)
+    if wrapper is None:
+        wrapper = generate_wrapper(init, sig, plan, policy)
+    if wrapper is None:
+        def wrapper(*args, **kwargs):
+            if policy.mode is not RAISE:
+                return policy.dispatch(plan, init, args, kwargs)
+
+            return plan.call(init, args, kwargs)
+
+    wrapper = wraps(init)(wrapper)
+    wrapper.__strict_plan__ = plan
+
+    return wrapper
+
+
+def checked_setattr(cls, hints: dict, strategy: Strategy):
+    """Generates `__setattr__` checking values assigned to fields.
+
+    Default value of field is accepted, as for arguments.
+    """
+    checks = {
+        field.name: ParamCheck(
+            field.name, hints[field.name],
+            Parameter.empty if field.default is MISSING else field.default,
+            strategy
+        )
+        for field in fields(cls) if field.name in hints
+    }
+    assign = cls.__setattr__
+    name = '%s.__setattr__' % cls.__qualname__
+
+    def __setattr__(self, attr: str, value) -> None:
+        check = checks.get(attr)
+        if check is not None:
+            action = policy.mode
+            if action is not RAISE:
+                action = policy.action()
+            if action is not OFF and not check.matches(value):
+                error = check.violation(value, name)
+                if error is not None and action is RAISE:
+                    raise error
+                if error is not None:
+                    warn(str(error), TypeHintWarning, stacklevel=2)
+
+        assign(self, attr, value)
+
+    __setattr__.__qualname__ = name
+
+    return __setattr__
@@ -0,0 +1,976 @@
+from abc import ABCMeta, get_cache_token
+from dataclasses import is_dataclass
+from collections.abc import (
+    AsyncGenerator, AsyncIterator, Callable, Generator, Iterator
+)
+from functools import partial
+from inspect import Parameter, signature
+from itertools import islice
+from operator import attrgetter
+from random import Random
+from typing import (
+    Annotated, Any, ClassVar, Final, Literal, Union, Type, TypeVar,
+    get_args, get_origin, get_type_hints
+)
+from types import MethodType
+import typing
+from weakref import ref
+
+from strict_hint.streams import (
+    CheckedAsyncGenerator, CheckedAsyncIterator,
+    CheckedGenerator, CheckedIterator
+)
+
+try:
+    from types import UnionType
+except ImportError:  # pragma: no cover
+    UnionType = Union
+
+CACHE_SIZE = 256
+UNIONS = (Union, UnionType)
+QUALIFIERS = (Annotated, ClassVar, Final)
+
+SHALLOW = 'shallow'
+FIRST_K = 'first-k'
+SAMPLE_K = 'sample-k'
+FULL = 'full'
+STRATEGIES = (SHALLOW, FIRST_K, SAMPLE_K, FULL)
+DEFAULT_K = 10
+
+
+class Hint(object):
+    """Compiled form of a single type hint.
+
+    Hints are resolved once, when decorated function is inspected, so that
+    matching a value costs no more than a single `isinstance` call.
+
+    Hint instances can be used as annotations directly. Hints with
+    `symbols` bind named sizes from values, which must agree between
+    all arguments of a single call. Hints that are `by_type` decide
+    on class of value alone, so decision can be shared by values of
+    the same class.
+    """
+
+    __slots__ = ('annotation', 'types')
+
+    symbols = ()
+    lazy = False
+    by_type = True
+
+    def __init__(self, annotation, types) -> None:
+        self.annotation = annotation
+        self.types = types
+
+    def matches(self, value) -> bool:
+        return isinstance(value, self.types)
+
+    def bind(self, value):
+        """Yields pairs of symbol and its size in matching value."""
+        return ()
+
+    def __repr__(self) -> str:
+        return '<%s %r>' % (type(self).__name__, self.annotation)
+
+
+class TypeCache(object):
+    """Bounded mapping from class to pass/fail decision.
+
+    Entries are keyed by `id(cls)` and dropped as soon as class is garbage
+    collected, so ids of dead classes are never reused. When cache is full,
+    oldest entry is evicted.
+    """
+
+    __slots__ = ('size', 'decisions', 'refs', 'token')
+
+    def __init__(self, size: int = CACHE_SIZE) -> None:
+        self.size = size
+        self.decisions = {}
+        self.refs = {}
+        self.token = get_cache_token()
+
+    def store(self, cls, decision: bool) -> None:
+        key = id(cls)
+        if key not in self.decisions and len(self.decisions) >= self.size:
+            self.__evict()
+
+        self.refs[key] = ref(cls, partial(self.__forget, key))
+        self.decisions[key] = decision
+
+    def clear(self) -> None:
+        self.decisions.clear()
+        self.refs.clear()
+
+    def __evict(self) -> None:
+        try:
+            key = next(iter(self.decisions))
+        except (StopIteration, RuntimeError):
+            return
+
+        self.decisions.pop(key, None)
+        self.refs.pop(key, None)
+
+    def __forget(self, key: int, reference) -> None:
+        if self.refs.get(key) is reference:
+            self.decisions.pop(key, None)
+            self.refs.pop(key, None)
+
+    def __len__(self) -> int:
+        return len(self.decisions)
+
+
+class CachedHint(Hint):
+    """Hint remembering `isinstance` decision for each class of value.
+
+    Positive decisions stay valid forever, negative ones are dropped once
+    any ABC registers new virtual subclass.
+    """
+
+    __slots__ = ('cache', 'decisions')
+
+    def __init__(self, annotation, types, size: int = CACHE_SIZE) -> None:
+        super().__init__(annotation, types)
+        self.cache = TypeCache(size)
+        self.decisions = self.cache.decisions
+
+    def matches(self, value) -> bool:
+        cls = type(value)
+        decision = self.decisions.get(id(cls))
+        if decision is True:
+            return True
+
+        if decision is None or self.__is_stale():
+            decision = isinstance(value, self.types)
+            self.cache.store(cls, decision)
+
+        return decision
+
+    def __is_stale(self) -> bool:
+        token = get_cache_token()
+        if token == self.cache.token:
+            return False
+
+        self.cache.clear()
+        self.cache.token = token
+        return True
+
+
+class ProtocolHint(Hint):
+    """Hint for `runtime_checkable` protocols, possibly in a union.
+
+    `isinstance` against protocol looks up all its members on each call
+    and may answer from ABC cache, which monkeypatching does not clear.
+    Here conformance is decided structurally, as `isinstance` does, once
+    per concrete class and remembered with members the class had then.
+    Later values of that class cost a lookup of the same members in one
+    call and comparison with them, so replacing or deleting a member of
+    the class invalidates the decision. Classes conforming only through
+    attributes of instances, and values that do not conform, are checked
+    in full.
+    """
+
+    __slots__ = ('plain', 'protocols', 'cache', 'decisions')
+
+    by_type = False
+
+    def __init__(self, annotation, types, size: int = CACHE_SIZE) -> None:
+        super().__init__(annotation, types)
+        if not isinstance(types, tuple):
+            types = (types,)
+        self.plain = tuple(item for item in types if not is_protocol(item))
+        self.protocols = []
+        for item in types:
+            if not is_protocol(item):
+                continue
+            names = sorted(protocol_members(item))
+            methods = tuple(
+                index for index, name in enumerate(names)
+                if callable(getattr(item, name, None))
+            )
+            self.protocols.append((attrgetter(*names), len(names), methods))
+        self.protocols = tuple(self.protocols)
+        self.cache = TypeCache(size)
+        self.decisions = self.cache.decisions
+
+    def matches(self, value) -> bool:
+        cls = type(value)
+        entry = self.decisions.get(id(cls))
+        if entry is not None:
+            members, snapshot = entry
+            if members is None:
+                return True
+            try:
+                if members(cls) == snapshot:
+                    return True
+            except AttributeError:
+                pass
+
+        if self.plain and isinstance(value, self.plain):
+            self.cache.store(cls, (None, None))
+            return True
+
+        for members, count, methods in self.protocols:
+            if not conforms(value, members, count, methods):
+                continue
+            if conforms(cls, members, count, methods):
+                self.cache.store(cls, (members, members(cls)))
+            return True
+
+        return False
+
+
+def conforms(value, members, count: int, methods: tuple) -> bool:
+    """Tells if value has all members, methods among them not `None`."""
+    try:
+        values = members(value)
+    except AttributeError:
+        return False
+
+    if count == 1:
+        values = (values,)
+
+    for index in methods:
+        if values[index] is None:
+            return False
+
+    return True
+
+
+class LiteralHint(Hint):
+    """Hint for `Literal[...]`, a single set membership test.
+
+    Values are kept together with their classes, so that `Literal[1]`
+    does not accept `True` or `1.0`.
+    """
+
+    __slots__ = ('values',)
+
+    by_type = False
+
+    def __init__(self, annotation) -> None:
+        values = tuple(literal_values(annotation))
+        super().__init__(
+            annotation, tuple(dict.fromkeys(type(value) for value in values))
+        )
+        self.values = frozenset((type(value), value) for value in values)
+
+    def matches(self, value) -> bool:
+        try:
+            return (type(value), value) in self.values
+        except TypeError:
+            return False
+
+
+class TypedDictHint(Hint):
+    """Hint for `TypedDict` classes, checks dict and set of its keys.
+
+    Required and allowed keys are computed once, values are checked only
+    with field hints, when strategy is other than shallow.
+    """
+
+    __slots__ = ('required', 'allowed', 'fields')
+
+    by_type = False
+
+    def __init__(self, annotation, fields: dict = None) -> None:
+        super().__init__(annotation, dict)
+        allowed = frozenset(getattr(annotation, '__annotations__', ()))
+        required = getattr(annotation, '__required_keys__', None)
+        if required is None:
+            required = allowed if annotation.__total__ else ()
+        self.required = frozenset(required)
+        self.allowed = allowed
+        self.fields = tuple((fields or {}).items())
+
+    def matches(self, value) -> bool:
+        if not isinstance(value, dict):
+            return False
+
+        keys = value.keys()
+        if not self.required <= keys or not keys <= self.allowed:
+            return False
+
+        for name, hint in self.fields:
+            if name in value and not hint.matches(value[name]):
+                return False
+
+        return True
+
+
+class SubclassHint(Hint):
+    """Hint for `type[T]` and `Type[T]`, value must be subclass of T."""
+
+    __slots__ = ('bases',)
+
+    by_type = False
+
+    def __init__(self, annotation, bases) -> None:
+        super().__init__(annotation, type)
+        self.bases = bases
+
+    def matches(self, value) -> bool:
+        return isinstance(value, type) and issubclass(value, self.bases)
+
+
+class UnionHint(Hint):
+    """Hint for unions of forms not reducible to `isinstance` check,
+    eg. `Optional[Literal['a', 'b']]`, value must match any of them.
+    """
+
+    __slots__ = ('items',)
+
+    by_type = False
+
+    def __init__(self, annotation, items: tuple) -> None:
+        super().__init__(
+            annotation, tuple(_flatten(item.types for item in items))
+        )
+        self.items = tuple(items)
+
+    def matches(self, value) -> bool:
+        for item in self.items:
+            if item.matches(value):
+                return True
+
+        return False
+
+
+class CallableHint(Hint):
+    """Hint for `Callable[[...], R]`, checks signature of passed callable.
+
+    Callable must accept as many positional arguments as hint lists and
+    its annotations, where they reduce to classes, must accept hinted
+    arguments and return hinted result. Result is not checked for `None`
+    and `Any`, nor arguments for `...`.
+
+    Signature is inspected once per callable, held weakly, and for bound
+    methods once per their function. Annotations assigned to function
+    after its first check are not noticed.
+    """
+
+    __slots__ = ('params', 'result', 'cache', 'decisions', 'methods')
+
+    by_type = False
+
+    def __init__(
+            self, annotation, params, result, size: int = CACHE_SIZE
+    ) -> None:
+        super().__init__(annotation, Callable)
+        self.params = params
+        self.result = result
+        self.cache = TypeCache(size)
+        self.decisions = self.cache.decisions
+        self.methods = TypeCache(size)
+
+    def matches(self, value) -> bool:
+        decision = self.decisions.get(id(value))
+        if decision is None:
+            decision = self.__lookup(value)
+
+        return decision
+
+    def __lookup(self, value) -> bool:
+        cache, key = self.cache, value
+        if type(value) is MethodType:
+            cache, key = self.methods, value.__func__
+            decision = cache.decisions.get(id(key))
+            if decision is not None:
+                return decision
+
+        decision = self.__decide(value)
+        try:
+            cache.store(key, decision)
+        except TypeError:
+            pass
+
+        return decision
+
+    def __decide(self, value) -> bool:
+        if not callable(value):
+            return False
+
+        try:
+            sig = signature(value, eval_str=True)
+        except Exception:
+            try:
+                sig = signature(value)
+            except (TypeError, ValueError):
+                return True
+
+        if self.params is not None:
+            try:
+                bound = sig.bind(*self.params)
+            except TypeError:
+                return False
+
+            for name, hinted in bound.arguments.items():
+                param = sig.parameters[name]
+                if param.kind is not Parameter.VAR_POSITIONAL:
+                    hinted = (hinted,)
+                for hint in hinted:
+                    if not is_subtype(hint, param.annotation):
+                        return False
+
+        returns = value if isinstance(value, type) else sig.return_annotation
+        return self.result is None or is_subtype(returns, self.result)
+
+
+class Strategy(object):
+    """Decides which elements of container are checked against item hints.
+
+    Cost per checked container, on top of its `isinstance` check:
+
+    - `shallow` - O(1), elements are not checked at all,
+    - `first-k` - O(k), only first k elements are checked,
+    - `sample-k` - O(k), k elements at random positions are checked,
+      sets and dicts have no random access, for them first k are checked,
+    - `full` - O(n), every element is checked.
+
+    Cost multiplies with nesting, `List[List[int]]` checks up to k * k items.
+
+    With positive `memo`, each argument remembers up to that many immutable
+    values that already passed, see `MemoHint`.
+    """
+
+    __slots__ = ('name', 'k', 'memo', 'random')
+
+    def __init__(
+            self, name: str = SHALLOW, k: int = DEFAULT_K, memo: int = 0
+    ) -> None:
+        if name not in STRATEGIES:
+            raise ValueError(
+                'Strategy must be one of %s, %s given' % (
+                    ', '.join(STRATEGIES), name
+                )
+            )
+
+        if k < 1:
+            raise ValueError('K must be positive, %s given' % k)
+
+        if memo < 0:
+            raise ValueError('Memo must not be negative, %s given' % memo)
+
+        self.name = name
+        self.k = k
+        self.memo = memo
+        self.random = Random()
+
+    @property
+    def is_shallow(self) -> bool:
+        return self.name == SHALLOW
+
+    def sequence(self, value):
+        """Picks elements from sequence supporting random access."""
+        if self.name == SAMPLE_K:
+            size = len(value)
+            if size <= self.k:
+                return value
+
+            randrange = self.random.randrange
+            return [value[randrange(size)] for _ in range(self.k)]
+
+        return self.iterable(value)
+
+    def iterable(self, value):
+        """Picks elements from any iterable."""
+        if self.name == FULL:
+            return value
+
+        return islice(value, self.k)
+
+
+SHALLOW_STRATEGY = Strategy()
+
+
+class SequenceHint(Hint):
+    """Hint for `List[T]`, `Set[T]` and variadic `Tuple[T, ...]`."""
+
+    __slots__ = ('item', 'pick')
+
+    by_type = False
+
+    def __init__(self, annotation, types, item: Hint, pick) -> None:
+        super().__init__(annotation, types)
+        self.item = item
+        self.pick = pick
+
+    def matches(self, value) -> bool:
+        if not isinstance(value, self.types):
+            return False
+
+        item = self.item.matches
+        for element in self.pick(value):
+            if not item(element):
+                return False
+
+        return True
+
+
+class TupleHint(Hint):
+    """Hint for fixed size `Tuple[A, B, ...]`, checks every position."""
+
+    __slots__ = ('items',)
+
+    by_type = False
+
+    def __init__(self, annotation, types, items: tuple) -> None:
+        super().__init__(annotation, types)
+        self.items = tuple(items)
+
+    def matches(self, value) -> bool:
+        if not isinstance(value, self.types) or len(value) != len(self.items):
+            return False
+
+        for item, element in zip(self.items, value):
+            if not item.matches(element):
+                return False
+
+        return True
+
+
+class MappingHint(Hint):
+    """Hint for `Dict[K, V]`."""
+
+    __slots__ = ('key', 'value', 'pick')
+
+    by_type = False
+
+    def __init__(
+            self, annotation, types, key: Hint, value: Hint, pick
+    ) -> None:
+        super().__init__(annotation, types)
+        self.key = key
+        self.value = value
+        self.pick = pick
+
+    def matches(self, value) -> bool:
+        if not isinstance(value, self.types):
+            return False
+
+        key = self.key.matches
+        val = self.value.matches
+        for k, v in self.pick(value.items()):
+            if not key(k) or not val(v):
+                return False
+
+        return True
+
+
+class IteratorHint(CachedHint):
+    """Hint for `Iterator[T]`, `Generator[T, S, R]` return values
+    and their asynchronous counterparts.
+
+    Returned iterator is wrapped in proxy that checks items lazily, as they
+    are consumed, adding O(1) per item. Proxy is picked by returned value,
+    so generators annotated as iterators still pass `send`, `throw` and
+    `close` through, and asynchronous ones `asend`, `athrow` and `aclose`.
+    """
+
+    __slots__ = ('item', 'result')
+
+    lazy = True
+
+    def __init__(self, annotation, types, item: Hint, result: Hint = None):
+        super().__init__(annotation, types)
+        self.item = item
+        self.result = result
+
+    def wrap(self, value, func_name: str, warn: bool = False):
+        if self.types is Generator or isinstance(value, Generator):
+            return CheckedGenerator(
+                value, self.item, self.result, func_name, warn
+            )
+
+        if self.types is AsyncGenerator or isinstance(value, AsyncGenerator):
+            return CheckedAsyncGenerator(value, self.item, func_name, warn)
+
+        if self.types is AsyncIterator:
+            return CheckedAsyncIterator(value, self.item, func_name, warn)
+
+        return CheckedIterator(value, self.item, func_name, warn)
+
+
+class ValueCache(object):
+    """Bounded set of values that passed a check, keyed by `id(value)`.
+
+    Each entry holds its value, weakly when value supports it, strongly
+    otherwise, eg. for tuples, so id is not reused while entry exists.
+    Entries of collected values are dropped, when cache is full, oldest
+    entry is evicted.
+    """
+
+    __slots__ = ('size', 'values')
+
+    def __init__(self, size: int = CACHE_SIZE) -> None:
+        self.size = size
+        self.values = {}
+
+    def __contains__(self, value) -> bool:
+        held = self.values.get(id(value))
+        if held is None:
+            return False
+
+        if type(held) is ref:
+            held = held()
+
+        return held is value
+
+    def store(self, value) -> None:
+        key = id(value)
+        if key not in self.values and len(self.values) >= self.size:
+            self.__evict()
+
+        try:
+            self.values[key] = ref(value, partial(self.__forget, key))
+        except TypeError:
+            self.values[key] = value
+
+    def clear(self) -> None:
+        self.values.clear()
+
+    def __evict(self) -> None:
+        try:
+            key = next(iter(self.values))
+        except (StopIteration, RuntimeError):
+            return
+
+        self.values.pop(key, None)
+
+    def __forget(self, key: int, reference) -> None:
+        if self.values.get(key) is reference:
+            self.values.pop(key, None)
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+
+class MemoHint(Hint):
+    """Hint remembering immutable values that already passed wrapped hint.
+
+    Later checks of the same object cost a lookup, instead of walking its
+    elements again. Only tuples, frozensets and frozen dataclasses that are
+    hashable, so hold no mutable elements, are remembered.
+    """
+
+    __slots__ = ('hint', 'cache')
+
+    by_type = False
+
+    def __init__(self, hint: Hint, size: int = CACHE_SIZE) -> None:
+        super().__init__(hint.annotation, hint.types)
+        self.hint = hint
+        self.cache = ValueCache(size)
+
+    @property
+    def symbols(self):
+        return self.hint.symbols
+
+    def bind(self, value):
+        return self.hint.bind(value)
+
+    def matches(self, value) -> bool:
+        if value in self.cache:
+            return True
+
+        if not self.hint.matches(value):
+            return False
+
+        if is_immutable(value):
+            self.cache.store(value)
+
+        return True
+
+
+def is_immutable(value) -> bool:
+    """Tells if value and all values it holds can not change."""
+    frozen = isinstance(value, (tuple, frozenset)) or (
+        is_dataclass(value) and type(value).__dataclass_params__.frozen
+    )
+    if not frozen:
+        return False
+
+    try:
+        hash(value)
+    except TypeError:
+        return False
+
+    return True
+
+
+def memoize(hint: Hint, strategy: Strategy) -> Hint:
+    """Wraps hint in `MemoHint` if strategy asks so and hint is costly."""
+    if not strategy.memo or hint.by_type or hint.lazy:
+        return hint
+
+    return MemoHint(hint, strategy.memo)
+
+
+def compile_hint(annotation, strategy: Strategy = SHALLOW_STRATEGY) -> Hint:
+    if isinstance(annotation, Hint):
+        return annotation
+
+    annotation = strip_qualifiers(annotation)
+    hint = compile_form(annotation, strategy)
+    if hint is not None:
+        return hint
+
+    types = resolve_types(annotation)
+    if types in (Iterator, Generator, AsyncIterator, AsyncGenerator):
+        hint = compile_iterator(annotation, types, strategy)
+        if hint is not None:
+            return hint
+
+    if not strategy.is_shallow:
+        hint = compile_container(annotation, types, strategy)
+        if hint is not None:
+            return hint
+
+    if is_protocol(types) or (
+            isinstance(types, tuple) and any(map(is_protocol, types))
+    ):
+        return ProtocolHint(annotation, types)
+
+    if is_costly(types):
+        return CachedHint(annotation, types)
+
+    return Hint(annotation, types)
+
+
+def compile_form(annotation, strategy: Strategy) -> Hint:
+    """Compiles forms that `isinstance` can not check, or returns `None`."""
+    if is_typeddict(annotation):
+        fields = None
+        if not strategy.is_shallow:
+            fields = {
+                name: compile_hint(hint, strategy)
+                for name, hint in get_type_hints(annotation).items()
+            }
+        return TypedDictHint(annotation, fields)
+
+    origin = get_origin(annotation)
+    if origin is Literal:
+        return LiteralHint(annotation)
+
+    if origin is type:
+        args = get_args(annotation)
+        if not args or args[0] is Any:
+            return None
+        return SubclassHint(annotation, resolve_types(args[0]))
+
+    if origin is Callable:
+        return compile_callable(annotation)
+
+    if origin in UNIONS:
+        items = [compile_hint(arg, strategy) for arg in get_args(annotation)]
+        if all(type(item) in PLAIN_HINTS for item in items):
+            return None
+        return UnionHint(annotation, items)
+
+    return None
+
+
+PLAIN_HINTS = (Hint, CachedHint, ProtocolHint)
+
+
+def compile_callable(annotation) -> Hint:
+    """Compiles hint checking signature of callable or `None` if not needed.
+
+    Arguments given with `ParamSpec` or `Concatenate` are not checked.
+    """
+    args = get_args(annotation)
+    if not args:
+        return None
+
+    params, result = args[0], args[-1]
+    params = tuple(params) if isinstance(params, list) else None
+    if result is None or resolve_types(result) in (object, type(None)):
+        result = None
+
+    if params is None and result is None:
+        return None
+
+    return CallableHint(annotation, params, result)
+
+
+def compile_iterator(annotation, types, strategy: Strategy) -> Hint:
+    """Compiles hint checking yielded items or `None` if not needed."""
+    args = getattr(annotation, '__args__', None) or ()
+    if not args:
+        return None
+
+    item = compile_hint(args[0], strategy)
+    result = None
+    if types is Generator and len(args) == 3:
+        result = compile_hint(args[2], strategy)
+        if result.types is object:
+            result = None
+
+    if item.types is object and result is None:
+        return None
+
+    return IteratorHint(annotation, types, item, result)
+
+
+def compile_container(annotation, types, strategy: Strategy) -> Hint:
+    """Compiles hint checking container elements or `None` if not needed."""
+    if isinstance(annotation, list):
+        args = tuple(annotation[:1])
+    else:
+        args = getattr(annotation, '__args__', None) or ()
+
+    if not args or types not in (list, tuple, set, frozenset, dict):
+        return None
+
+    if types is tuple and args[-1] is not Ellipsis:
+        if args == ((),):
+            args = ()
+        items = [compile_hint(arg, strategy) for arg in args]
+        return TupleHint(annotation, types, items)
+
+    items = [compile_hint(arg, strategy) for arg in args if arg is not ...]
+    if all(item.types is object for item in items):
+        return None
+
+    if types is dict:
+        key, value = items
+        return MappingHint(annotation, types, key, value, strategy.iterable)
+
+    pick = strategy.sequence
+    if types in (set, frozenset):
+        pick = strategy.iterable
+
+    return SequenceHint(annotation, types, items[0], pick)
+
+
+def is_costly(types) -> bool:
+    """Tells if `isinstance` against types is slow enough to be cached."""
+    if not isinstance(types, tuple):
+        types = (types,)
+
+    if any(getattr(item, '_is_protocol', False) for item in types):
+        return False
+
+    return len(types) > 3 or any(isinstance(item, ABCMeta) for item in types)
+
+
+def is_subtype(annotation, base) -> bool:
+    """Tells if values of annotation are accepted by base annotation.
+
+    Missing annotations and ones that do not reduce to classes accept all.
+    """
+    if annotation is Parameter.empty or base is Parameter.empty:
+        return True
+
+    types, bases = _classes(annotation), _classes(base)
+    if types is None or bases is None:
+        return True
+
+    try:
+        return all(issubclass(cls, bases) for cls in types)
+    except TypeError:
+        return True
+
+
+def _classes(annotation):
+    if annotation is None:
+        return (type(None),)
+
+    types = resolve_types(annotation)
+    if not isinstance(types, tuple):
+        types = (types,)
+
+    if all(isinstance(cls, type) for cls in types):
+        return types
+
+    return None
+
+
+def strip_qualifiers(annotation):
+    """Removes `Annotated` metadata, `Final` and `ClassVar` wrappers."""
+    while get_origin(annotation) in QUALIFIERS:
+        args = get_args(annotation)
+        if not args:
+            return Any
+        annotation = args[0]
+
+    return annotation
+
+
+def literal_values(annotation):
+    for value in get_args(annotation):
+        if get_origin(value) is Literal:
+            yield from literal_values(value)
+        else:
+            yield value
+
+
+def is_typeddict(annotation) -> bool:
+    return (
+        isinstance(annotation, type) and issubclass(annotation, dict)
+        and hasattr(annotation, '__total__')
+    )
+
+
+def is_protocol(cls) -> bool:
+    """Tells if class is protocol that can be used with `isinstance`."""
+    return bool(
+        getattr(cls, '_is_protocol', False)
+        and getattr(cls, '_is_runtime_protocol', False)
+    )
+
+
+def protocol_members(protocol) -> frozenset:
+    members = getattr(protocol, '__protocol_attrs__', None)
+    if members is None:
+        members = typing._get_protocol_attrs(protocol)
+
+    return frozenset(members)
+
+
+def resolve_types(annotation) -> Type:
+    """Reduces annotation to something accepted by `isinstance`."""
+    if annotation is Any:
+        return object
+
+    if isinstance(annotation, list):
+        return list
+
+    if isinstance(annotation, tuple):
+        return tuple(_flatten(resolve_types(item) for item in annotation))
+
+    if isinstance(annotation, TypeVar):
+        if annotation.__bound__ is not None:
+            return resolve_types(annotation.__bound__)
+        if annotation.__constraints__:
+            return resolve_types(annotation.__constraints__)
+        return object
+
+    if hasattr(annotation, '__supertype__'):
+        return resolve_types(annotation.__supertype__)
+
+    if get_origin(annotation) in QUALIFIERS:
+        return resolve_types(strip_qualifiers(annotation))
+
+    if get_origin(annotation) is Literal:
+        return tuple(dict.fromkeys(map(type, literal_values(annotation))))
+
+    if is_typeddict(annotation):
+        return dict
+
+    if get_origin(annotation) in UNIONS:
+        return tuple(
+            _flatten(resolve_types(arg) for arg in annotation.__args__)
+        )
+
+    origin = getattr(annotation, '__origin__', None)
+    if isinstance(origin, type):
+        return origin
+
+    return annotation
+
+
+def _flatten(types):
+    for item in types:
+        if isinstance(item, tuple):
+            yield from item
+        else:
+            yield item
@@ -0,0 +1,163 @@
+from functools import wraps
+from os import environ
+from time import perf_counter
+from warnings import warn
+
+from strict_hint.errors import TypeHintError, TypeHintWarning
+from strict_hint.policy import OFF, RAISE, WARN
+
+ENV_STATS = 'STRICT_HINT_STATS'
+
+
+class Stats(object):
+    """Counters of single instrumented function.
+
+    Times are cumulative, in seconds. Counters are updated without locks,
+    so under heavy contention some increments can be lost.
+    """
+
+    __slots__ = (
+        'name', 'calls', 'checked', 'skipped', 'failures',
+        'check_time', 'call_time'
+    )
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.reset()
+
+    def reset(self) -> None:
+        self.calls = 0
+        self.checked = 0
+        self.skipped = 0
+        self.failures = 0
+        self.check_time = 0.0
+        self.call_time = 0.0
+
+    def snapshot(self) -> dict:
+        return {
+            'calls': self.calls,
+            'checked': self.checked,
+            'skipped': self.skipped,
+            'failures': self.failures,
+            'check_time': self.check_time,
+            'call_time': self.call_time,
+        }
+
+
+class Registry(object):
+    """Stats of all instrumented functions, keyed by qualified name."""
+
+    def __init__(self, enabled: bool = False) -> None:
+        self.enabled = enabled
+        self.records = {}
+
+    def record(self, func) -> Stats:
+        name = '%s.%s' % (func.__module__, func.__qualname__)
+        return self.records.setdefault(name, Stats(name))
+
+    def snapshot(self) -> dict:
+        return {
+            name: record.snapshot()
+            for name, record in list(self.records.items())
+        }
+
+    def reset(self) -> None:
+        for record in list(self.records.values()):
+            record.reset()
+
+
+registry = Registry(bool(environ.get(ENV_STATS)))
+
+
+def enable_stats(enabled: bool = True) -> None:
+    """Instruments functions decorated from now on."""
+    registry.enabled = enabled
+
+
+def stats() -> dict:
+    """Snapshot of counters of all instrumented functions."""
+    return registry.snapshot()
+
+
+def reset_stats() -> None:
+    registry.reset()
+
+
+def timed_check(record: Stats, action: str, check, value, *extra):
+    """Runs check, counting its time and failure.
+
+    Returns what check returned, or value if failure was only warned about.
+    """
+    start = perf_counter()
+    try:
+        return check(value, *extra)
+    except TypeHintError as e:
+        record.failures += 1
+        if action is RAISE:
+            raise
+        warn(str(e), TypeHintWarning, stacklevel=3)
+        return value
+    finally:
+        record.check_time += perf_counter() - start
+
+
+def instrument(func, plan, policy, record: Stats):
+    """Wrapper counting calls, checks and time spent in checks and func."""
+    check = plan.check
+    check_return = plan.check_return
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        record.calls += 1
+        action = policy.action()
+        if action is OFF:
+            record.skipped += 1
+        else:
+            record.checked += 1
+            timed_check(record, action, check, args, kwargs)
+
+        start = perf_counter()
+        try:
+            result = func(*args, **kwargs)
+        finally:
+            record.call_time += perf_counter() - start
+
+        if action is OFF:
+            return result
+
+        return timed_check(
+            record, action, check_return, result, action is WARN
+        )
+
+    return wrapper
+
+
+def instrument_coroutine(func, plan, policy, record: Stats):
+    """Same as `instrument`, call time includes time spent awaiting."""
+    check = plan.check
+    check_return = plan.check_return
+
+    @wraps(func)
+    async def wrapper(*args, **kwargs):
+        record.calls += 1
+        action = policy.action()
+        if action is OFF:
+            record.skipped += 1
+        else:
+            record.checked += 1
+            timed_check(record, action, check, args, kwargs)
+
+        start = perf_counter()
+        try:
+            result = await func(*args, **kwargs)
+        finally:
+            record.call_time += perf_counter() - start
+
+        if action is OFF:
+            return result
+
+        return timed_check(
+            record, action, check_return, result, action is WARN
+        )
+
+    return wrapper
@@ -0,0 +1,208 @@
+"""Checking selected functions through `sys.monitoring`, without wrappers.
+
+Requires Python 3.12 or newer, so it is not imported by the rest of package.
+
+Functions are checked on `PY_START` and `PY_RETURN` events of their code
+objects, which are enabled only for attached functions. Attached function
+keeps its identity and, once detached, runs with no overhead at all:
+
+    from strict_hint import monitor
+
+    monitor.attach(handler)
+    ...
+    monitor.disable()
+"""
+import sys
+from inspect import (
+    CO_ASYNC_GENERATOR, CO_COROUTINE, CO_GENERATOR, CO_VARARGS,
+    CO_VARKEYWORDS, unwrap
+)
+from sys import monitoring
+from types import MethodType
+from warnings import warn
+
+from strict_hint.errors import TypeHintError, TypeHintWarning
+from strict_hint.policy import OFF, RAISE, Policy
+from strict_hint.strict_hint import Plan, resolve_signature
+
+TOOL_NAME = 'strict_hint'
+EVENTS = monitoring.events.PY_START | monitoring.events.PY_RETURN
+SUSPENDABLE = CO_GENERATOR | CO_COROUTINE | CO_ASYNC_GENERATOR
+
+
+class Entry(object):
+    """Plan of attached function and names of its parameters."""
+
+    __slots__ = (
+        'plan', 'positional', 'keywords', 'varargs', 'varkw', 'returns'
+    )
+
+    def __init__(self, func) -> None:
+        code = func.__code__
+        self.plan = Plan(func, resolve_signature(func))
+        names = code.co_varnames
+        count = code.co_argcount + code.co_kwonlyargcount
+        self.positional = names[:code.co_argcount]
+        self.keywords = names[code.co_argcount:count]
+        self.varargs = None
+        self.varkw = None
+        if code.co_flags & CO_VARARGS:
+            self.varargs = names[count]
+            count += 1
+        if code.co_flags & CO_VARKEYWORDS:
+            self.varkw = names[count]
+        self.returns = not code.co_flags & SUSPENDABLE
+
+
+class Monitor(object):
+    """Checks attached functions, enforced according to its own policy.
+
+    Checks are kept per code object, so attaching a closure attaches all
+    closures of the same definition and attaching a bound method attaches
+    the method for all instances. Events are enforced separately, in
+    `sample` mode arguments and return value of a call are sampled apart.
+
+    Tool id is acquired when first function is attached and released with
+    all its callbacks when last one is detached. Returned iterators are
+    checked as a whole, since returned value can not be replaced, and
+    values returned by generators and coroutines are not checked.
+    """
+
+    def __init__(
+            self, mode: str = RAISE, every: int = None, rate: float = None
+    ) -> None:
+        self.policy = Policy(mode, every, rate)
+        self.entries = {}
+        self.tool = None
+
+    def attach(self, *funcs) -> None:
+        for func in funcs:
+            func = function_of(func)
+            entry = Entry(func)
+            if self.tool is None:
+                self.__acquire()
+            self.entries[func.__code__] = entry
+            monitoring.set_local_events(self.tool, func.__code__, EVENTS)
+
+    def detach(self, *funcs) -> None:
+        for func in funcs:
+            code = function_of(func).__code__
+            if self.entries.pop(code, None) is not None:
+                monitoring.set_local_events(self.tool, code, 0)
+
+        if not self.entries:
+            self.__release()
+
+    def disable(self) -> None:
+        """Detaches all functions and releases tool id."""
+        for code in list(self.entries):
+            monitoring.set_local_events(self.tool, code, 0)
+        self.entries.clear()
+        self.__release()
+
+    @property
+    def attached(self) -> tuple:
+        return tuple(self.entries)
+
+    def __acquire(self) -> None:
+        for tool in range(6):
+            if monitoring.get_tool(tool) is None:
+                monitoring.use_tool_id(tool, TOOL_NAME)
+                break
+        else:
+            raise RuntimeError('No free sys.monitoring tool id')
+
+        monitoring.register_callback(
+            tool, monitoring.events.PY_START, self.__start
+        )
+        monitoring.register_callback(
+            tool, monitoring.events.PY_RETURN, self.__return
+        )
+        self.tool = tool
+
+    def __release(self) -> None:
+        tool = self.tool
+        if tool is None:
+            return
+
+        monitoring.register_callback(tool, monitoring.events.PY_START, None)
+        monitoring.register_callback(tool, monitoring.events.PY_RETURN, None)
+        monitoring.free_tool_id(tool)
+        self.tool = None
+
+    def __start(self, code, offset: int):
+        entry = self.entries.get(code)
+        if entry is None:
+            return monitoring.DISABLE
+
+        action = self.policy.action()
+        if action is OFF:
+            return
+
+        values = sys._getframe(1).f_locals
+        args = tuple(values[name] for name in entry.positional)
+        kwargs = {name: values[name] for name in entry.keywords}
+        if entry.varargs is not None:
+            args += values[entry.varargs]
+        if entry.varkw is not None:
+            kwargs.update(values[entry.varkw])
+        self.__enforce(action, entry.plan.check, args, kwargs)
+
+    def __return(self, code, offset: int, result):
+        entry = self.entries.get(code)
+        if entry is None:
+            return monitoring.DISABLE
+
+        if not entry.returns:
+            return
+
+        action = self.policy.action()
+        if action is not OFF:
+            self.__enforce(action, entry.plan.check_return, result, True)
+
+    @staticmethod
+    def __enforce(action: str, check, *args) -> None:
+        if action is RAISE:
+            check(*args)
+            return
+
+        try:
+            check(*args)
+        except TypeHintError as e:
+            warn(str(e), TypeHintWarning, stacklevel=3)
+
+
+def function_of(func):
+    """Returns undecorated function, of bound methods the unbound one.
+
+    Code of method receives instance as well, so checks must be planned
+    from signature that includes it.
+    """
+    func = unwrap(func)
+    if isinstance(func, MethodType):
+        return func.__func__
+
+    return func
+
+
+monitor = Monitor()
+
+
+def set_mode(mode: str, every: int = None, rate: float = None) -> None:
+    """Switches how attached functions are checked, see `Policy`."""
+    monitor.policy.set(mode, every, rate)
+
+
+def attach(*funcs) -> None:
+    """Starts checking calls of funcs, without wrapping them."""
+    monitor.attach(*funcs)
+
+
+def detach(*funcs) -> None:
+    """Stops checking calls of funcs."""
+    monitor.detach(*funcs)
+
+
+def disable() -> None:
+    """Stops checking all functions, leaving no overhead."""
+    monitor.disable()
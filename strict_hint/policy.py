@@ -0,0 +1,137 @@
+from itertools import count
+from os import environ
+from warnings import warn
+
+from strict_hint.errors import TypeHintError, TypeHintWarning
+
+OFF = 'off'
+SAMPLE = 'sample'
+WARN = 'warn'
+RAISE = 'raise'
+MODES = (OFF, SAMPLE, WARN, RAISE)
+
+ENV_MODE = 'STRICT_HINT_MODE'
+ENV_SAMPLE = 'STRICT_HINT_SAMPLE'
+
+
+class Policy(object):
+    """Decides how type checks are enforced on each call.
+
+    - `off` - checks are skipped,
+    - `sample` - only every n-th call is checked, by counter not by chance,
+    - `warn` - failed checks emit `TypeHintWarning` instead of raising,
+    - `raise` - failed checks raise `TypeHintError`.
+
+    Wrappers read mode on every call, so it can be switched at any time.
+    Calls are counted with `itertools.count`, which is advanced atomically,
+    so sampling needs no lock and keeps no other state shared by threads.
+    """
+
+    __slots__ = ('mode', 'every', 'ticks')
+
+    def __init__(
+            self, mode: str = RAISE, every: int = None, rate: float = None
+    ) -> None:
+        self.mode = RAISE
+        self.every = 1
+        self.ticks = count(1)
+        self.set(mode, every, rate)
+
+    @classmethod
+    def from_env(cls, env=environ) -> 'Policy':
+        sample = env.get(ENV_SAMPLE)
+        every, rate = None, None
+        if sample:
+            if '.' in sample:
+                rate = float(sample)
+            else:
+                every = int(sample)
+
+        return cls(env.get(ENV_MODE) or RAISE, every, rate)
+
+    def set(self, mode: str, every: int = None, rate: float = None) -> None:
+        if mode not in MODES:
+            raise ValueError(
+                'Mode must be one of %s, %s given' % (', '.join(MODES), mode)
+            )
+
+        if rate is not None:
+            if not 0 < rate <= 1:
+                raise ValueError('Rate must be in (0, 1], %s given' % rate)
+            every = round(1 / rate)
+
+        if every is not None:
+            if every < 1:
+                raise ValueError('Every must be positive, %s given' % every)
+            self.every = every
+            self.ticks = count(1)
+
+        self.mode = MODES[MODES.index(mode)]
+
+    def action(self) -> str:
+        """Tells what to do with current call, `off`, `warn` or `raise`."""
+        mode = self.mode
+        if mode is not SAMPLE:
+            return mode
+
+        if next(self.ticks) % self.every:
+            return OFF
+
+        return RAISE
+
+    def dispatch(self, plan, func, args: tuple, kwargs: dict):
+        """Calls func when mode is other than `raise`."""
+        action = self.action()
+        if action is OFF:
+            return func(*args, **kwargs)
+
+        if action is RAISE:
+            return plan.call(func, args, kwargs)
+
+        try:
+            plan.check(args, kwargs)
+        except TypeHintError as e:
+            warn(str(e), TypeHintWarning, stacklevel=3)
+
+        result = func(*args, **kwargs)
+        try:
+            result = plan.check_return(result, True)
+        except TypeHintError as e:
+            warn(str(e), TypeHintWarning, stacklevel=3)
+
+        return result
+
+    async def dispatch_async(self, plan, func, args: tuple, kwargs: dict):
+        """Awaits coroutine func when mode is other than `raise`."""
+        action = self.action()
+        if action is OFF:
+            return await func(*args, **kwargs)
+
+        if action is RAISE:
+            plan.check(args, kwargs)
+            return plan.check_return(await func(*args, **kwargs))
+
+        try:
+            plan.check(args, kwargs)
+        except TypeHintError as e:
+            warn(str(e), TypeHintWarning, stacklevel=3)
+
+        result = await func(*args, **kwargs)
+        try:
+            result = plan.check_return(result, True)
+        except TypeHintError as e:
+            warn(str(e), TypeHintWarning, stacklevel=3)
+
+        return result
+
+
+policy = Policy.from_env()
+
+
+def set_mode(mode: str, every: int = None, rate: float = None) -> None:
+    """Switches global policy, also for already decorated functions."""
+    policy.set(mode, every, rate)
+
+
+def get_mode() -> str:
+    return policy.mode
@@ -0,0 +1,168 @@
+from functools import wraps
+from warnings import warn
+
+from strict_hint.errors import (
+    ReturnValueTypeHintError, TypeHintWarning, YieldValueTypeHintError
+)
+
+
+class CheckedIterator(object):
+    """Proxy checking each item as it is consumed from wrapped iterator.
+
+    Items are neither buffered nor read ahead, each costs single check.
+    """
+
+    __slots__ = ('iterator', 'item', 'func_name', 'warn')
+
+    def __init__(self, iterator, item, func_name: str, warn: bool = False):
+        self.iterator = iterator
+        self.item = item
+        self.func_name = func_name
+        self.warn = warn
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        return self._check(next(self.iterator))
+
+    def _check(self, value):
+        if not self.item.matches(value):
+            self._report(YieldValueTypeHintError(
+                self.func_name, self.item.annotation, type(value)
+            ))
+
+        return value
+
+    def _report(self, error) -> None:
+        if not self.warn:
+            raise error
+
+        warn(str(error), TypeHintWarning, stacklevel=4)
+
+
+class CheckedGenerator(CheckedIterator):
+    """Generator proxy, `send`, `throw` and `close` are passed through.
+
+    Value returned by generator is checked when it stops.
+    """
+
+    __slots__ = ('result',)
+
+    def __init__(
+            self, generator, item, result, func_name: str, warn: bool = False
+    ) -> None:
+        super().__init__(generator, item, func_name, warn)
+        self.result = result
+
+    def __next__(self):
+        return self.send(None)
+
+    def send(self, value):
+        try:
+            value = self.iterator.send(value)
+        except StopIteration as e:
+            self._check_result(e.value)
+            raise
+
+        return self._check(value)
+
+    def throw(self, *args):
+        try:
+            value = self.iterator.throw(*args)
+        except StopIteration as e:
+            self._check_result(e.value)
+            raise
+
+        return self._check(value)
+
+    def close(self) -> None:
+        self.iterator.close()
+
+    def __getattr__(self, name: str):
+        return getattr(self.iterator, name)
+
+    def _check_result(self, value) -> None:
+        result = self.result
+        if result is None or value is None or result.matches(value):
+            return
+
+        self._report(ReturnValueTypeHintError(
+            self.func_name, result.annotation, type(value)
+        ))
+
+
+class CheckedAsyncIterator(CheckedIterator):
+    """Asynchronous iterator proxy checking each item as it is consumed."""
+
+    __slots__ = ()
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        return self._check(await self.iterator.__anext__())
+
+
+class CheckedAsyncGenerator(CheckedAsyncIterator):
+    """Asynchronous generator proxy, `asend`, `athrow`, `aclose` pass."""
+
+    __slots__ = ()
+
+    async def __anext__(self):
+        return await self.asend(None)
+
+    async def asend(self, value):
+        return self._check(await self.iterator.asend(value))
+
+    async def athrow(self, *args):
+        return self._check(await self.iterator.athrow(*args))
+
+    async def aclose(self) -> None:
+        await self.iterator.aclose()
+
+    def __getattr__(self, name: str):
+        return getattr(self.iterator, name)
+
+
+def delegate_async_generator(func, call):
+    """Wraps call returning asynchronous generator in generator function.
+
+    Decorated function remains an async generator function. Call is made
+    once wrapper generator is first advanced, values sent and exceptions
+    thrown into wrapper are passed to generator it returned.
+    """
+    @wraps(func)
+    async def wrapper(*args, **kwargs):
+        generator = call(*args, **kwargs)
+        try:
+            item = await generator.__anext__()
+        except StopAsyncIteration:
+            return
+
+        while True:
+            try:
+                sent = yield item
+            except GeneratorExit:
+                aclose = getattr(generator, 'aclose', None)
+                if aclose is not None:
+                    await aclose()
+                raise
+            except BaseException as error:
+                athrow = getattr(generator, 'athrow', None)
+                if athrow is None:
+                    raise
+                try:
+                    item = await athrow(error)
+                except StopAsyncIteration:
+                    return
+            else:
+                try:
+                    if sent is None:
+                        item = await generator.__anext__()
+                    else:
+                        item = await generator.asend(sent)
+                except StopAsyncIteration:
+                    return
+
+    return wrapper
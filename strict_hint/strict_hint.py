@@ -1,120 +1,741 @@
 from functools import wraps
-from inspect import signature, Parameter
-from typing import Tuple, List, Dict, Type
+from inspect import (
+    isasyncgenfunction, iscoroutinefunction, signature, Parameter
+)
+from threading import RLock, Thread
+from types import FunctionType
+from typing import get_type_hints
+from weakref import WeakSet, WeakValueDictionary
 
+from strict_hint.boundary import guard, guard_coroutine
+from strict_hint.codegen import generate_deferred, generate_wrapper
+from strict_hint.deferred import collector, deferred, deferred_coroutine
+from strict_hint.errors import (  # noqa: F401
+    TypeHintError, TypeHintWarning,
+    ArgumentTypeHintError, ArgumentsTypeHintError,
+    ReturnValueTypeHintError, DimensionHintError
+)
+from strict_hint.hints import (
+    compile_hint, memoize, Strategy, SHALLOW, SHALLOW_STRATEGY, DEFAULT_K,
+    FIRST_K, SAMPLE_K
+)
+from strict_hint.instrument import (
+    instrument, instrument_coroutine, registry
+)
+from strict_hint.policy import Policy, OFF, RAISE, policy as global_policy
+from strict_hint.streams import delegate_async_generator
 
-class TypeHintError(TypeError):
-    pass
+POSITIONAL = (Parameter.POSITIONAL_ONLY, Parameter.POSITIONAL_OR_KEYWORD)
+KEYWORD = (Parameter.POSITIONAL_OR_KEYWORD, Parameter.KEYWORD_ONLY)
+VARIADIC = (Parameter.VAR_POSITIONAL, Parameter.VAR_KEYWORD)
+SKIPPED_MEMBERS = ('__init_subclass__', '__class_getitem__', '__new__')
 
+pending = WeakSet()
+building = RLock()
+
+
+class ParamCheck(object):
+    """Check for single annotated parameter, built at decoration time."""
+
+    __slots__ = (
+        'name', 'position', 'hint', 'matches', 'has_default', 'default'
+    )
 
-class ArgumentTypeHintError(TypeHintError):
     def __init__(
-            self, argument_name, func_name, expected_type, given_type
+            self, name: str, annotation, default,
+            strategy: Strategy = SHALLOW_STRATEGY, position: int = None
     ) -> None:
-        super().__init__(
-            'Argument %s passed to %s must be an instance of %s, %s given' % (
-                argument_name, func_name, expected_type, given_type
+        self.name = name
+        self.position = position
+        self.hint = memoize(compile_hint(annotation, strategy), strategy)
+        self.matches = self.hint.matches
+        self.has_default = default is not Parameter.empty
+        self.default = default
+
+    def reject(self, value, func_name: str) -> None:
+        """Raises for value that did not match, unless it is the default."""
+        error = self.violation(value, func_name)
+        if error is not None:
+            raise error
+
+    def accepts_type(self, cls) -> bool:
+        """Tells if values of class can match, decided on class alone.
+
+        Class of the default value is accepted, hints that can not be
+        decided on class, eg. protocols with data members, accept all.
+        """
+        if self.has_default and cls is type(self.default):
+            return True
+
+        try:
+            return issubclass(cls, self.hint.types)
+        except TypeError:
+            return True
+
+    def is_default(self, value) -> bool:
+        """Tells if value is the default, equality raising tells it is not.
+
+        Values compared elementwise, eg. arrays, are default only when
+        their comparison reduces to truth.
+        """
+        if not self.has_default:
+            return False
+
+        if value is self.default:
+            return True
+
+        try:
+            return bool(value == self.default)
+        except Exception:
+            return False
+
+    def violation(self, value, func_name: str) -> ArgumentTypeHintError:
+        if self.is_default(value):
+            return None
+
+        return ArgumentTypeHintError(
+            self.name, func_name, self.hint.annotation, type(value),
+            self.position
+        )
+
+
+class Layout(object):
+    """Checks for all annotated parameters and return value.
+
+    Positional checks are indexed by position, with `None` for parameters
+    that have no annotation, keyword checks are keyed by name.
+    Constraints are parameters with symbolic dimensions, that must agree
+    between all arguments of a single call.
+
+    Items of annotated `*args` and values of `**kwargs` are checked each,
+    or only up to k of them with `first-k` and `sample-k` strategies.
+    `arity` counts named positional parameters, `named` holds names of
+    parameters that can be passed by keyword.
+
+    Layouts are shared between functions with identical annotations,
+    names, kinds and defaults of parameters, see `build_layout`.
+    """
+
+    __slots__ = (
+        'positional', 'keywords', 'returns', 'constraints',
+        'variadic', 'extra', 'arity', 'named', 'pick', 'limit',
+        '__weakref__'
+    )
+
+    def __init__(self, sig, strategy: Strategy = SHALLOW_STRATEGY) -> None:
+        self.keywords = {}
+        self.returns = None
+        self.constraints = ()
+        self.variadic = None
+        self.extra = None
+        self.pick = None
+        self.limit = None
+        if strategy.name in (FIRST_K, SAMPLE_K):
+            self.pick = strategy.sequence
+            self.limit = strategy.k
+
+        positional = []
+        constraints = []
+        for param in sig.parameters.values():
+            if param.kind in VARIADIC:
+                if param.annotation is not param.empty:
+                    check = ParamCheck(
+                        param.name, param.annotation, Parameter.empty,
+                        strategy
+                    )
+                    if param.kind is Parameter.VAR_POSITIONAL:
+                        self.variadic = check
+                    else:
+                        self.extra = check
+                continue
+
+            position = None
+            if param.kind in POSITIONAL:
+                position = len(positional)
+
+            if param.annotation is param.empty:
+                check = None
+            else:
+                check = ParamCheck(
+                    param.name, param.annotation, param.default, strategy,
+                    position
+                )
+
+            if param.kind in POSITIONAL:
+                positional.append(check)
+            if param.kind in KEYWORD and check is not None:
+                self.keywords[param.name] = check
+            if check is not None and check.hint.symbols:
+                constraints.append((position, check))
+
+        self.arity = len(positional)
+        self.named = frozenset(
+            param.name for param in sig.parameters.values()
+            if param.kind in KEYWORD
+        )
+        while positional and positional[-1] is None:
+            positional.pop()
+        self.positional = tuple(positional)
+        if len(constraints) > 1:
+            self.constraints = tuple(constraints)
+
+        if sig.return_annotation is not sig.empty:
+            self.returns = memoize(
+                compile_hint(sig.return_annotation, strategy), strategy
             )
+
+
+layouts = WeakValueDictionary()
+
+
+def build_layout(sig, strategy: Strategy = SHALLOW_STRATEGY) -> Layout:
+    """Returns layout for signature, shared when signature is hashable."""
+    key = (
+        strategy.name,
+        strategy.k,
+        strategy.memo,
+        sig.return_annotation,
+        tuple(
+            (param.name, param.kind, param.annotation, param.default)
+            for param in sig.parameters.values()
         )
+    )
+    try:
+        layout = layouts.get(key)
+    except TypeError:
+        return Layout(sig, strategy)
+
+    if layout is None:
+        layout = layouts.setdefault(key, Layout(sig, strategy))
+
+    return layout
 
 
-class ReturnValueTypeHintError(TypeHintError):
+class Plan(object):
+    """Checks of single decorated function.
+
+    Plan holds only name of function and references to its shared layout.
+    With `collect`, failed `check` reports all invalid arguments at once.
+    """
+
+    __slots__ = (
+        'func_name', 'collect', 'layout',
+        'positional', 'keywords', 'returns', 'constraints',
+        'variadic', 'extra'
+    )
+
     def __init__(
-            self, func_name, expected_type, given_type
+            self, func, sig=None, strategy: Strategy = SHALLOW_STRATEGY,
+            collect: bool = False
     ) -> None:
-        super().__init__(
-            "Value returned by %s must be an instance of %s, %s returned" % (
-                func_name, expected_type, given_type
+        layout = build_layout(sig or signature(func), strategy)
+        self.func_name = func_name(func)
+        self.collect = collect
+        self.layout = layout
+        self.positional = layout.positional
+        self.keywords = layout.keywords
+        self.returns = layout.returns
+        self.constraints = layout.constraints
+        self.variadic = layout.variadic
+        self.extra = layout.extra
+
+    def check_args(self, args: tuple) -> None:
+        for check, value in zip(self.positional, args):
+            if check is not None and not check.matches(value):
+                check.reject(value, self.func_name)
+
+        if self.variadic is not None and len(args) > self.layout.arity:
+            self.check_variadic(args[self.layout.arity:])
+
+    def check_kwargs(self, kwargs: dict) -> None:
+        keywords = self.keywords
+        for name, value in kwargs.items():
+            check = keywords.get(name)
+            if check is not None and not check.matches(value):
+                check.reject(value, self.func_name)
+
+        if self.extra is not None:
+            self.check_extra(kwargs)
+
+    def check_variadic(self, values: tuple) -> None:
+        """Checks items of `*args`, past named positional parameters."""
+        for error in self.variadic_violations(values):
+            raise error
+
+    def check_extra(self, kwargs: dict) -> None:
+        """Checks keyword arguments captured by `**kwargs`."""
+        for error in self.extra_violations(kwargs):
+            raise error
+
+    def variadic_violations(self, values: tuple):
+        check = self.variadic
+        layout = self.layout
+        indexes = range(len(values))
+        if layout.pick is not None:
+            indexes = layout.pick(indexes)
+
+        for index in indexes:
+            value = values[index]
+            if not check.matches(value):
+                yield ArgumentTypeHintError(
+                    check.name, self.func_name, check.hint.annotation,
+                    type(value), layout.arity + index
+                )
+
+    def extra_violations(self, kwargs: dict):
+        check = self.extra
+        named = self.layout.named
+        limit = self.layout.limit
+        for name, value in kwargs.items():
+            if name in named:
+                continue
+
+            if limit is not None:
+                if not limit:
+                    return
+                limit -= 1
+
+            if not check.matches(value):
+                yield ArgumentTypeHintError(
+                    name, self.func_name, check.hint.annotation, type(value)
+                )
+
+    def check_constraints(self, args: tuple, kwargs: dict) -> None:
+        sizes = {}
+        for index, check in self.constraints:
+            if index is not None and index < len(args):
+                value = args[index]
+            elif check.name in kwargs:
+                value = kwargs[check.name]
+            else:
+                continue
+
+            if not check.matches(value):
+                continue
+
+            for symbol, size in check.hint.bind(value):
+                expected = sizes.setdefault(symbol, size)
+                if expected != size:
+                    raise DimensionHintError(
+                        check.name, self.func_name, symbol, expected, size
+                    )
+
+    def check(self, args: tuple, kwargs: dict) -> None:
+        try:
+            self.check_args(args)
+            if kwargs:
+                self.check_kwargs(kwargs)
+        except ArgumentTypeHintError:
+            if self.collect:
+                self.check_all(args, kwargs)
+            raise
+
+        if self.constraints:
+            self.check_constraints(args, kwargs)
+
+    def check_all(self, args: tuple, kwargs: dict) -> None:
+        """Raises single error listing every invalid argument."""
+        errors = []
+        for check, value in zip(self.positional, args):
+            if check is not None and not check.matches(value):
+                errors.append(check.violation(value, self.func_name))
+
+        keywords = self.keywords
+        for name, value in kwargs.items():
+            check = keywords.get(name)
+            if check is not None and not check.matches(value):
+                errors.append(check.violation(value, self.func_name))
+
+        arity = self.layout.arity
+        if self.variadic is not None and len(args) > arity:
+            errors.extend(self.variadic_violations(args[arity:]))
+        if self.extra is not None:
+            errors.extend(self.extra_violations(kwargs))
+
+        errors = [error for error in errors if error is not None]
+        if errors:
+            raise ArgumentsTypeHintError(errors)
+
+        if self.constraints:
+            self.check_constraints(args, kwargs)
+
+    def type_violations(
+            self, types: tuple, keyword_types: tuple, result_type
+    ) -> list:
+        """Lists errors of call known only by classes of its values.
+
+        Elements of containers and symbolic dimensions are not checked.
+        """
+        errors = []
+        for check, cls in zip(self.positional, types):
+            if check is not None and not check.accepts_type(cls):
+                errors.append(ArgumentTypeHintError(
+                    check.name, self.func_name, check.hint.annotation, cls,
+                    check.position
+                ))
+
+        variadic = self.variadic
+        arity = self.layout.arity
+        if variadic is not None:
+            for index, cls in enumerate(types[arity:], arity):
+                if not variadic.accepts_type(cls):
+                    errors.append(ArgumentTypeHintError(
+                        variadic.name, self.func_name,
+                        variadic.hint.annotation, cls, index
+                    ))
+
+        keywords = self.keywords
+        for name, cls in keyword_types:
+            check = keywords.get(name)
+            if check is None and name not in self.layout.named:
+                check = self.extra
+            if check is not None and not check.accepts_type(cls):
+                errors.append(ArgumentTypeHintError(
+                    name, self.func_name, check.hint.annotation, cls,
+                    check.position
+                ))
+
+        returns = self.returns
+        if returns is not None and result_type is not type(None):
+            try:
+                accepted = issubclass(result_type, returns.types)
+            except TypeError:
+                accepted = True
+            if not accepted:
+                errors.append(ReturnValueTypeHintError(
+                    self.func_name, returns.annotation, result_type
+                ))
+
+        return errors
+
+    def call(self, func, args: tuple, kwargs: dict):
+        self.check(args, kwargs)
+        result = func(*args, **kwargs)
+        return self.check_return(result)
+
+    def check_return(self, result, warn: bool = False):
+        """Checks returned value, lazy hints return it wrapped."""
+        returns = self.returns
+        if returns is None or result is None:
+            return result
+
+        if not returns.matches(result):
+            raise ReturnValueTypeHintError(
+                self.func_name, returns.annotation, type(result)
             )
-        )
+
+        if returns.lazy:
+            return returns.wrap(result, self.func_name, warn)
+
+        return result
 
 
 class StrictHint(object):
-    __func = None
-    __sig = None
+    """Decorator checking arguments and return value against annotations.
+
+    Unless `mode` is given, checks are enforced according to global policy,
+    which can be switched at runtime with `set_mode`. With `mode='off'`
+    decorated function is returned as is.
+
+    Container elements are checked according to `strategy`, one of
+    `shallow`, `first-k`, `sample-k` or `full`, see `Strategy` for costs.
+    With positive `memo`, up to that many immutable values that passed are
+    remembered per argument and not walked again.
+
+    With `instrument`, wrapper counts calls, checks and time spent in them,
+    see `stats`. By default functions are instrumented only when stats were
+    enabled before they were decorated.
+
+    With `collect`, single error lists all invalid arguments of a call,
+    instead of the first one only.
+
+    With `lazy`, decoration only wraps function, its signature is inspected
+    and plan built on first call, or by `warm`. Lazily decorated functions
+    cost one additional call each time they are called.
+
+    Instances hold only options and are not changed after construction,
+    all state of decorated function lives in its wrapper. Single instance
+    can decorate any number of functions, also from many threads.
+    """
+
+    __slots__ = (
+        '__fast', '__instrument', '__collect', '__lazy', '__boundary',
+        '__deferred', '__strategy', '__policy'
+    )
+
+    def __init__(
+            self,
+            fast: bool = False,
+            mode: str = None,
+            every: int = None,
+            rate: float = None,
+            strategy: str = SHALLOW,
+            k: int = DEFAULT_K,
+            memo: int = 0,
+            instrument: bool = None,
+            collect: bool = False,
+            lazy: bool = False,
+            boundary=None,
+            deferred: bool = False
+    ) -> None:
+        self.__fast = fast
+        self.__instrument = instrument
+        self.__collect = collect
+        self.__lazy = lazy
+        self.__boundary = boundary
+        self.__deferred = deferred
+        self.__strategy = Strategy(strategy, k, memo)
+        self.__policy = global_policy
+        if mode is not None:
+            self.__policy = Policy(mode, every, rate)
 
     def __call__(self, func):
-        self.__func = func
-        self.__sig = signature(func)
+        if isinstance(func, type):
+            return self.__wrap_class(func)
 
-        @wraps(self.__func)
-        def wrapper(*args, **kwargs):
-            self.__assert_args(args)
-            self.__assert_kwargs(kwargs)
-            result = self.__func(*args, **kwargs)
-            self.__assert_return(result)
+        return self.__wrap(func)
 
-            return result
+    def __wrap(self, func, localns: dict = None):
+        if self.__policy.mode is OFF and self.__policy is not global_policy:
+            return func
+
+        if self.__lazy:
+            return self.__defer(func, localns)
+
+        return self.__build(func, localns)
+
+    def __build(self, func, localns: dict = None):
+        sig = resolve_signature(func, localns)
+        plan = Plan(func, sig, self.__strategy, self.__collect)
+        wrapper = self.__wrapper(func, sig, plan)
+        if self.__boundary:
+            if iscoroutinefunction(func):
+                wrapper = guard_coroutine(func, wrapper, self.__boundary)
+            else:
+                wrapper = guard(func, wrapper, self.__boundary)
+        if isasyncgenfunction(func) and not isasyncgenfunction(wrapper):
+            wrapper = delegate_async_generator(func, wrapper)
+        wrapper.__strict_plan__ = plan
 
         return wrapper
 
-    def __assert_args(self, args: tuple) -> None:
-        argvals = dict(zip(self.__sig.parameters.keys(), args))
-        if not argvals:
-            return
+    def __defer(self, func, localns: dict = None):
+        """Wraps function, building its checked wrapper on first call.
 
-        for param in argvals.keys():
-            self.__assert_param(param, self.__sig.parameters[param], argvals)
+        Wrapper is built once, under a lock, and then called directly.
+        Until then `__strict_plan__` is `None` and function is `pending`.
+        """
+        build = self.__build
+        target = None
 
-    def __assert_kwargs(self, kwargs: dict) -> None:
-        if not kwargs:
-            return
+        def resolve():
+            nonlocal target
+            with building:
+                if target is None:
+                    built = build(func, localns)
+                    wrapper.__strict_plan__ = built.__strict_plan__
+                    pending.discard(wrapper)
+                    target = built
 
-        for param in kwargs.keys():
-            self.__assert_param(param, self.__sig.parameters[param], kwargs)
+            return target
 
-    def __assert_param(
-            self, name: str, param: Parameter, values: dict
-    ) -> None:
-        if param.annotation == param.empty:
-            return
-
-        val = values[name]
-        if not self.__matches_hint(val, param.annotation, param.default):
-            raise ArgumentTypeHintError(
-                name,
-                self.__func_name(self.__func),
-                param.annotation,
-                type(values[name])
+        if iscoroutinefunction(func):
+            @wraps(func)
+            async def wrapper(*args, **kwargs):
+                return await (target or resolve())(*args, **kwargs)
+        elif isasyncgenfunction(func):
+            def call(*args, **kwargs):
+                return (target or resolve())(*args, **kwargs)
+
+            wrapper = delegate_async_generator(func, call)
+        else:
+            @wraps(func)
+            def wrapper(*args, **kwargs):
+                return (target or resolve())(*args, **kwargs)
+
+        wrapper.__strict_plan__ = None
+        wrapper.__strict_resolve__ = resolve
+        pending.add(wrapper)
+
+        return wrapper
+
+    def __wrap_class(self, cls, inherit: bool = True):
+        """Decorates annotated methods, static and class methods and
+        properties defined in class.
+
+        With `inherit`, methods defined in subclasses are decorated too,
+        while inherited ones keep their already decorated versions.
+        """
+        localns = {cls.__name__: cls}
+        for name, member in list(vars(cls).items()):
+            if name in SKIPPED_MEMBERS:
+                continue
+
+            wrapped = self.__wrap_member(member, localns)
+            if wrapped is not member:
+                setattr(cls, name, wrapped)
+
+        if inherit:
+            self.__hook_subclasses(cls)
+
+        return cls
+
+    def __wrap_member(self, member, localns: dict):
+        if isinstance(member, staticmethod):
+            func = self.__wrap_member(member.__func__, localns)
+            return member if func is member.__func__ else staticmethod(func)
+
+        if isinstance(member, classmethod):
+            func = self.__wrap_member(member.__func__, localns)
+            return member if func is member.__func__ else classmethod(func)
+
+        if isinstance(member, property):
+            fget, fset, fdel = (
+                func if func is None else self.__wrap_member(func, localns)
+                for func in (member.fget, member.fset, member.fdel)
             )
+            if (fget, fset, fdel) == (member.fget, member.fset, member.fdel):
+                return member
+            return property(fget, fset, fdel, member.__doc__)
 
-    def __assert_return(self, result: Parameter) -> None:
-        if self.__sig.return_annotation == self.__sig.empty:
-            return
+        if not isinstance(member, FunctionType) \
+                or hasattr(member, '__strict_plan__') \
+                or not getattr(member, '__annotations__', None):
+            return member
 
-        if not self.__matches_hint(result, self.__sig.return_annotation):
-            raise ReturnValueTypeHintError(
-                self.__func_name(self.__func),
-                self.__sig.return_annotation,
-                type(result)
+        return self.__wrap(member, localns)
+
+    def __hook_subclasses(self, cls) -> None:
+        original = vars(cls).get('__init_subclass__')
+        wrap_class = self.__wrap_class
+
+        def __init_subclass__(subclass, **kwargs):
+            if original is not None:
+                original.__get__(None, subclass)(**kwargs)
+            else:
+                super(cls, subclass).__init_subclass__(**kwargs)
+            wrap_class(subclass, inherit=False)
+
+        cls.__init_subclass__ = classmethod(__init_subclass__)
+
+    def __wrapper(self, func, sig, plan: Plan):
+        policy = self.__policy
+
+        if self.__deferred and iscoroutinefunction(func):
+            return deferred_coroutine(func, plan, policy)
+
+        if self.__deferred and self.__fast:
+            wrapper = generate_deferred(func, sig, plan, policy, collector)
+            if wrapper is not None:
+                collector.start()
+                return wraps(func)(wrapper)
+
+        if self.__deferred:
+            return deferred(func, plan, policy)
+
+        instrumented = self.__instrument
+        if instrumented is None:
+            instrumented = registry.enabled
+
+        if instrumented and iscoroutinefunction(func):
+            return instrument_coroutine(
+                func, plan, policy, registry.record(func)
             )
 
-    def __matches_hint(self, value, expected, default=None) -> bool:
-        if type(expected) == list:
-            expected = list
+        if instrumented:
+            return instrument(func, plan, policy, registry.record(func))
 
-        try:
-            if expected.__module__ == 'typing':
-                expected = self.__simplify_typing(expected)
-        except AttributeError:
-            pass
-
-        return value == default or isinstance(value, expected)
-
-    def __simplify_typing(self, expected) -> Type:
-        if not hasattr(expected, '__name__'):
-            return expected.__args__
-
-        mapping = {
-            Tuple.__name__: tuple,
-            List.__name__: list,
-            Dict.__name__: dict,
-        }
-        if expected.__name__ in mapping:
-            return mapping[expected.__name__]
-
-        if hasattr(expected, '__supertype__'):
-            return expected.__supertype__
-
-    def __func_name(self, func) -> str:
-        return func.__qualname__.split('.<locals>.', 1)[-1]
+        if iscoroutinefunction(func):
+            return self.__wrap_coroutine(func, plan, policy)
+
+        if self.__fast and not plan.collect:
+            wrapper = generate_wrapper(func, sig, plan, policy)
+            if wrapper is not None:
+                return wraps(func)(wrapper)
+
+        if plan.collect:
+            @wraps(func)
+            def wrapper(*args, **kwargs):
+                if policy.mode is not RAISE:
+                    return policy.dispatch(plan, func, args, kwargs)
+
+                return plan.call(func, args, kwargs)
+
+            return wrapper
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if policy.mode is not RAISE:
+                return policy.dispatch(plan, func, args, kwargs)
+
+            plan.check_args(args)
+            if kwargs:
+                plan.check_kwargs(kwargs)
+            if plan.constraints:
+                plan.check_constraints(args, kwargs)
+            result = func(*args, **kwargs)
+
+            return plan.check_return(result)
+
+        return wrapper
+
+    def __wrap_coroutine(self, func, plan: Plan, policy: Policy):
+        """Wraps coroutine function, checking its awaited result.
+
+        Arguments are checked as soon as wrapper coroutine starts, before
+        decorated one is awaited. No additional tasks are created.
+        """
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            if policy.mode is not RAISE:
+                return await policy.dispatch_async(plan, func, args, kwargs)
+
+            plan.check(args, kwargs)
+
+            return plan.check_return(await func(*args, **kwargs))
+
+        return wrapper
+
+
+def warm(background: bool = False):
+    """Builds plans of all lazily decorated functions not called yet.
+
+    With `background`, plans are built in a daemon thread, which is
+    started and returned.
+    """
+    if background:
+        thread = Thread(target=warm, name='strict-hint-warm', daemon=True)
+        thread.start()
+        return thread
+
+    for wrapper in list(pending):
+        wrapper.__strict_resolve__()
+
+
+def resolve_signature(func, localns: dict = None):
+    """Returns signature with string annotations evaluated, if possible."""
+    sig = signature(func)
+    annotations = [param.annotation for param in sig.parameters.values()]
+    annotations.append(sig.return_annotation)
+    if not any(isinstance(annotation, str) for annotation in annotations):
+        return sig
+
+    try:
+        hints = get_type_hints(func, localns=localns)
+    except Exception:
+        return sig
+
+    parameters = [
+        param.replace(annotation=hints.get(param.name, param.annotation))
+        if isinstance(param.annotation, str) else param
+        for param in sig.parameters.values()
+    ]
+    returns = sig.return_annotation
+    if isinstance(returns, str):
+        returns = hints.get('return', returns)
+
+    return sig.replace(parameters=parameters, return_annotation=returns)
+
+
+def func_name(func) -> str:
+    return func.__qualname__.split('.<locals>.', 1)[-1]
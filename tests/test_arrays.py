@@ -0,0 +1,108 @@
+from pytest import importorskip, raises
+
+from strict_hint import check_batch, strict
+from strict_hint.errors import DimensionHintError
+
+numpy = importorskip('numpy')
+Array = importorskip('strict_hint.arrays').Array
+
+VECTOR = Array(shape=('N',))
+ROWS = Array(shape=('N', 2))
+
+
+class TestArray:
+    def test_accept_array(self):
+        assert Array().matches(numpy.zeros(3))
+        assert not Array().matches([0, 0, 0])
+
+    def test_check_dtype(self):
+        assert Array(float).matches(numpy.zeros(3))
+        assert not Array('int32').matches(numpy.zeros(3))
+
+    def test_check_abstract_dtype(self):
+        assert Array(numpy.floating).matches(numpy.zeros(3, 'float32'))
+        assert not Array(numpy.floating).matches(numpy.zeros(3, int))
+
+    def test_check_ndim(self):
+        assert Array(ndim=2).matches(numpy.zeros((2, 3)))
+        assert not Array(ndim=2).matches(numpy.zeros(3))
+
+    def test_check_fixed_shape(self):
+        hint = Array(shape=(None, 3))
+
+        assert hint.matches(numpy.zeros((5, 3)))
+        assert not hint.matches(numpy.zeros((5, 4)))
+        assert not hint.matches(numpy.zeros(3))
+
+    def test_check_symbolic_dimensions_within_array(self):
+        hint = Array(shape=('N', 'N'))
+
+        assert hint.matches(numpy.zeros((2, 2)))
+        assert not hint.matches(numpy.zeros((2, 3)))
+
+    def test_raise_error_for_mismatched_ndim_and_shape(self):
+        with raises(ValueError):
+            Array(ndim=1, shape=(2, 2))
+
+    def test_repr(self):
+        assert repr(Array(float, shape=('N', 3))) == \
+            'Array(dtype=float64, shape=(N, 3))'
+
+
+class TestArrayArguments:
+    def test_accept_matching_symbolic_dimensions(self):
+        @strict
+        def func(x: VECTOR, y: ROWS):
+            return len(x)
+
+        assert func(numpy.zeros(3), y=numpy.zeros((3, 2))) == 3
+
+    def test_raise_error_for_mismatched_symbolic_dimensions(self):
+        @strict
+        def func(x: VECTOR, y: VECTOR):
+            return len(x)
+
+        with raises(DimensionHintError) as e:
+            func(numpy.zeros(3), numpy.zeros(4))
+
+        assert str(e.value) == \
+            'Dimension N of argument y passed to func must be 3, 4 given'
+
+    def test_fast_wrapper_checks_symbolic_dimensions(self):
+        @strict(fast=True)
+        def func(x: VECTOR, *, y: VECTOR):
+            return len(x)
+
+        with raises(DimensionHintError):
+            func(numpy.zeros(3), y=numpy.zeros(4))
+
+    def test_raise_error_for_wrong_dtype(self):
+        @strict
+        def func(x: Array(int)):
+            return x
+
+        with raises(TypeError) as e:
+            func(numpy.zeros(3))
+
+        assert str(e.value) == (
+            'Argument x passed to func must be an instance of '
+            'Array(dtype=int64), <class \'numpy.ndarray\'> given'
+        )
+
+    def test_raise_error_for_defaulted_parameter(self):
+        def func(x: Array(float, ndim=1) = None):
+            return x
+
+        for wrapper in (strict(func), strict(fast=True)(func)):
+            assert wrapper() is None
+            with raises(TypeError):
+                wrapper(numpy.zeros((2, 2)))
+
+    def test_batch_violation_for_defaulted_parameter(self):
+        @strict
+        def func(x: Array(float, ndim=1) = None):
+            return x
+
+        violations = check_batch(func, [(None,), (numpy.zeros((2, 2)),)])
+
+        assert [violation.row for violation in violations] == [1]
@@ -0,0 +1,178 @@
+from asyncio import run
+from inspect import isasyncgenfunction, iscoroutinefunction
+from typing import AsyncGenerator, AsyncIterator
+
+from pytest import mark, raises, warns
+
+from strict_hint import strict
+from strict_hint.errors import TypeHintWarning, YieldValueTypeHintError
+
+
+async def consume(items) -> list:
+    return [item async for item in items]
+
+
+class TestCoroutine:
+    arg_msg = "Argument r passed to func must be an instance of %s, %s given"
+    ret_msg = "Value returned by func must be an instance of %s, %s returned"
+
+    def test_remain_coroutine_function(self):
+        @strict
+        async def func(r: int) -> int:
+            return r
+
+        assert iscoroutinefunction(func)
+
+    def test_accept_awaited_result(self):
+        @strict
+        async def func(r: int) -> int:
+            return r
+
+        assert run(func(1)) == 1
+
+    def test_raise_error_when_argument_type_different(self):
+        @strict
+        async def func(r: int) -> int:
+            return r
+
+        with raises(TypeError) as e:
+            run(func('foo'))
+
+        assert str(e.value) == self.arg_msg % (int, str)
+
+    def test_raise_error_when_awaited_type_different(self):
+        @strict
+        async def func(r) -> int:
+            return r
+
+        with raises(TypeError) as e:
+            run(func('foo'))
+
+        assert str(e.value) == self.ret_msg % (int, str)
+
+    def test_fast_falls_back_for_coroutine(self):
+        @strict(fast=True)
+        async def func(r) -> int:
+            return r
+
+        assert run(func(1)) == 1
+        with raises(TypeError):
+            run(func('foo'))
+
+    def test_warn_instead_of_raise(self):
+        @strict(mode='warn')
+        async def func(r: int) -> int:
+            return r
+
+        with warns(TypeHintWarning):
+            assert run(func('foo')) == 'foo'
+
+
+class TestAsyncGenerator:
+    def test_check_items_as_consumed(self):
+        @strict
+        async def func(r) -> AsyncIterator[int]:
+            for item in r:
+                yield item
+
+        assert run(consume(func([1, 2]))) == [1, 2]
+        with raises(YieldValueTypeHintError):
+            run(consume(func([1, 'foo'])))
+
+    def test_pass_asend_and_aclose_through(self):
+        @strict
+        async def func() -> AsyncGenerator[int, int]:
+            received = 0
+            while True:
+                received = yield received * 2
+
+        async def drive():
+            gen = func()
+            first = await gen.__anext__()
+            second = await gen.asend(2)
+            await gen.aclose()
+            return first, second
+
+        assert run(drive()) == (0, 4)
+
+    def test_check_arguments_when_started(self):
+        @strict
+        async def func(r: int) -> AsyncIterator[int]:
+            yield r
+
+        generator = func('foo')
+        with raises(TypeError):
+            run(consume(generator))
+
+    @mark.parametrize('options', [
+        {}, {'fast': True}, {'lazy': True}, {'boundary': True},
+        {'deferred': True}
+    ])
+    def test_remain_async_generator_function(self, options):
+        @strict(**options)
+        async def func(r: int) -> AsyncIterator[int]:
+            yield r
+
+        assert isasyncgenfunction(func)
+        assert run(consume(func(1))) == [1]
+
+    def test_pass_athrow_through(self):
+        @strict
+        async def func() -> AsyncGenerator[int, None]:
+            try:
+                yield 1
+            except ValueError:
+                yield 2
+
+        async def drive():
+            gen = func()
+            first = await gen.__anext__()
+            second = await gen.athrow(ValueError())
+            return first, second
+
+        assert run(drive()) == (1, 2)
+
+    @mark.parametrize('options', [{}, {'fast': True}, {'lazy': True}])
+    def test_pass_asend_athrow_aclose_through_iterator(self, options):
+        events = []
+
+        @strict(**options)
+        async def func() -> AsyncIterator[int]:
+            try:
+                while True:
+                    try:
+                        received = yield 1
+                        events.append(received)
+                    except ValueError:
+                        events.append('thrown')
+            finally:
+                events.append('closed')
+
+        async def drive():
+            gen = func()
+            await gen.__anext__()
+            await gen.asend(5)
+            await gen.athrow(ValueError())
+            await gen.aclose()
+
+        run(drive())
+        assert events == [5, 'thrown', 'closed']
+
+    def test_close_wrapped_generator(self):
+        closed = []
+
+        @strict
+        async def func(r: int):
+            try:
+                yield r
+                yield r
+            finally:
+                closed.append(True)
+
+        async def drive():
+            gen = func(1)
+            await gen.__anext__()
+            await gen.aclose()
+
+        run(drive())
+        assert closed == [True]
@@ -0,0 +1,63 @@
+from typing import List
+
+from strict_hint import strict, check_batch, Violation
+from strict_hint.errors import ArgumentTypeHintError
+
+
+class TestCheckBatch:
+    def test_accept_valid_rows(self):
+        @strict
+        def func(a: int, b: str):
+            pass
+
+        assert check_batch(func, [(1, 'a'), (2, 'b')]) == []
+
+    def test_report_all_invalid_rows(self):
+        @strict
+        def func(a: int, b: str):
+            pass
+
+        rows = [(1, 'a'), ('x', 'b'), (3, 3), ('y', 4)]
+
+        assert check_batch(func, rows) == [
+            Violation(1, 'a', 'func', int, str),
+            Violation(2, 'b', 'func', str, int),
+            Violation(3, 'a', 'func', int, str),
+            Violation(3, 'b', 'func', str, int),
+        ]
+
+    def test_check_keyword_rows(self):
+        def func(a: int, *, b: str = ''):
+            pass
+
+        assert check_batch(func, [{'a': 1, 'b': 'b'}, {'b': 2}]) == [
+            Violation(1, 'b', 'func', str, int),
+        ]
+
+    def test_accept_default_value(self):
+        def func(a: int = None):
+            pass
+
+        assert check_batch(func, [(None,), ('a',)]) == [
+            Violation(1, 'a', 'func', int, str),
+        ]
+
+    def test_check_elements_of_each_row(self):
+        @strict(strategy='full')
+        def func(a: List[int]):
+            pass
+
+        assert check_batch(func, [([1],), (['a'],)]) == [
+            Violation(1, 'a', 'func', List[int], list),
+        ]
+
+    def test_build_error_on_demand(self):
+        def func(a: int):
+            pass
+
+        violation, = check_batch(func, [('a',)])
+
+        assert isinstance(violation.error(), ArgumentTypeHintError)
+        assert str(violation) == \
+            "Argument a passed to func must be an instance of %s, %s given" \
+            % (int, str)
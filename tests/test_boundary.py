@@ -0,0 +1,116 @@
+from asyncio import run
+from threading import Thread
+
+from pytest import raises
+
+from strict_hint import strict
+from strict_hint.boundary import entered
+from strict_hint.errors import (
+    ArgumentTypeHintError, ReturnValueTypeHintError
+)
+
+
+@strict(boundary=True)
+def inner(a: int) -> int:
+    return a
+
+
+@strict(boundary=True)
+def outer(a, call=inner):
+    return call(a)
+
+
+@strict(boundary=True)
+def bad_outer(a: int) -> int:
+    return str(a)
+
+
+class TestBoundary:
+    def test_check_outermost_call(self):
+        with raises(ArgumentTypeHintError):
+            inner('a')
+
+    def test_skip_nested_calls(self):
+        assert outer('a') == 'a'
+        assert entered.get() is None
+
+    def test_check_boundary_return_value(self):
+        with raises(ReturnValueTypeHintError):
+            bad_outer(1)
+
+    def test_reset_after_failure(self):
+        with raises(ReturnValueTypeHintError):
+            bad_outer(1)
+
+        assert entered.get() is None
+        with raises(ArgumentTypeHintError):
+            inner('a')
+
+    def test_check_calls_in_other_threads(self):
+        errors = []
+
+        def work():
+            try:
+                inner('a')
+            except TypeError as e:
+                errors.append(e)
+
+        def call(a):
+            thread = Thread(target=work)
+            thread.start()
+            thread.join()
+
+        outer(1, call=call)
+
+        assert len(errors) == 1
+
+    def test_coroutines(self):
+        @strict(boundary=True)
+        async def first(a: int) -> int:
+            return await second(a)
+
+        @strict(boundary=True)
+        async def second(a: int) -> int:
+            return inner(a)
+
+        assert run(first(1)) == 1
+        with raises(ArgumentTypeHintError):
+            run(second('a'))
+
+
+class TestNamedBoundary:
+    def test_skip_calls_from_same_scope(self):
+        @strict(boundary='app')
+        def service(a: int) -> int:
+            return int(repository(str(a)))
+
+        @strict(boundary='app')
+        def repository(a: int) -> int:
+            return a
+
+        assert service(1) == 1
+        with raises(ArgumentTypeHintError):
+            repository('1')
+
+    def test_check_calls_from_other_scope(self):
+        @strict(boundary='app')
+        def service(a: int) -> int:
+            return a
+
+        @strict(boundary='lib')
+        def client(a):
+            return service(a)
+
+        with raises(ArgumentTypeHintError):
+            client('a')
+
+    def test_fast_wrappers(self):
+        @strict(boundary='app', fast=True)
+        def service(a: int) -> int:
+            return int(repository(str(a)))
+
+        @strict(boundary='app', fast=True)
+        def repository(a: int) -> int:
+            return a
+
+        assert service(1) == 1
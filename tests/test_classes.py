@@ -0,0 +1,150 @@
+from pytest import raises
+
+from strict_hint import strict
+
+
+class TestClassDecorator:
+    arg_msg = "Argument %s passed to %s must be an instance of %s, %s given"
+
+    def test_check_methods(self):
+        @strict
+        class Calculator:
+            def add(self, a: int, b: int) -> int:
+                return a + b
+
+        assert Calculator().add(1, 2) == 3
+        with raises(TypeError) as e:
+            Calculator().add(1, 'b')
+
+        assert str(e.value) == self.arg_msg % ('b', 'Calculator.add', int, str)
+
+    def test_check_static_and_class_methods(self):
+        @strict
+        class Calculator:
+            @staticmethod
+            def double(a: int) -> int:
+                return a * 2
+
+            @classmethod
+            def triple(cls, a: int) -> int:
+                return a * 3
+
+        assert Calculator.double(2) == 4
+        assert Calculator.triple(2) == 6
+        assert isinstance(vars(Calculator)['double'], staticmethod)
+        assert isinstance(vars(Calculator)['triple'], classmethod)
+        with raises(TypeError):
+            Calculator.double('a')
+        with raises(TypeError):
+            Calculator().triple('a')
+
+    def test_check_properties(self):
+        @strict
+        class Box:
+            def __init__(self, value: int) -> None:
+                self._value = value
+
+            @property
+            def value(self) -> int:
+                return self._value
+
+            @value.setter
+            def value(self, value: int) -> None:
+                self._value = value
+
+        box = Box(1)
+        box.value = 2
+
+        assert box.value == 2
+        with raises(TypeError):
+            box.value = 'a'
+        with raises(TypeError):
+            Box('a')
+
+    def test_resolve_forward_reference_to_class(self):
+        @strict
+        class Node:
+            def copy(self) -> 'Node':
+                return self
+
+            def broken(self) -> 'Node':
+                return 1
+
+        node = Node()
+
+        assert node.copy() is node
+        with raises(TypeError):
+            node.broken()
+
+    def test_skip_methods_without_annotations(self):
+        def method(self):
+            return 1
+
+        @strict
+        class Plain:
+            pass
+
+        Plain.method = method
+        strict(Plain)
+
+        assert vars(Plain)['method'] is method
+
+    def test_reuse_inherited_methods(self):
+        @strict
+        class Base:
+            def get(self, a: int) -> int:
+                return a
+
+        class Child(Base):
+            pass
+
+        assert vars(Child).get('get') is None
+        with raises(TypeError):
+            Child().get('a')
+
+    def test_decorate_methods_of_subclasses(self):
+        @strict
+        class Base:
+            def get(self, a: int) -> int:
+                return a
+
+        class Child(Base):
+            def get(self, a: str) -> str:
+                return a
+
+            def put(self, a: int) -> None:
+                pass
+
+        assert Child().get('a') == 'a'
+        with raises(TypeError):
+            Child().get(1)
+        with raises(TypeError):
+            Child().put('a')
+
+    def test_keep_own_init_subclass(self):
+        registered = []
+
+        @strict
+        class Base:
+            def __init_subclass__(cls, **kwargs):
+                super().__init_subclass__(**kwargs)
+                registered.append(cls)
+
+        class Child(Base):
+            def put(self, a: int) -> None:
+                pass
+
+        assert registered == [Child]
+        with raises(TypeError):
+            Child().put('a')
+
+    def test_do_not_wrap_already_decorated_methods(self):
+        class Plain:
+            @strict
+            def get(self, a: int) -> int:
+                return a
+
+        method = vars(Plain)['get']
+        strict(Plain)
+
+        assert vars(Plain)['get'] is method
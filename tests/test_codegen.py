@@ -0,0 +1,113 @@
+from inspect import signature
+from typing import List, Optional
+
+from pytest import raises
+
+from strict_hint import strict
+
+
+class TestFastWrapper:
+    arg_msg = "Argument %s passed to func must be an instance of %s, %s given"
+    ret_msg = "Value returned by func must be an instance of %s, %s returned"
+
+    def test_accept_no_arguments(self):
+        @strict(fast=True)
+        def func():
+            return ''
+
+        assert func() == ''
+
+    def test_keeps_signature(self):
+        def func(a: int, b, *args, c: str = '', **kwargs) -> int:
+            return a
+
+        assert signature(strict(fast=True)(func)) == signature(func)
+
+    def test_accept_positional_and_keyword(self):
+        @strict(fast=True)
+        def func(a: int, b: str):
+            return a, b
+
+        assert func(1, 'b') == (1, 'b')
+        assert func(b='b', a=1) == (1, 'b')
+
+    def test_accept_default_value_even_when_different_type(self):
+        @strict(fast=True)
+        def func(r: int = 'foo'):
+            return r
+
+        assert func() == 'foo'
+        assert func('foo') == 'foo'
+
+    def test_accept_variadic_arguments(self):
+        @strict(fast=True)
+        def func(r: int, *args, o: Optional[str] = None, **kwargs):
+            return r, args, o, kwargs
+
+        assert func(1, 2, 3, o='o', x=4) == (1, (2, 3), 'o', {'x': 4})
+
+    def test_accept_positional_only_arguments(self):
+        namespace = {}
+        exec('def func(a: int, /, b: int): return a + b', namespace)
+
+        assert strict(fast=True)(namespace['func'])(1, b=2) == 3
+
+    def test_accept_parameters_named_as_builtins(self):
+        @strict(fast=True)
+        def func(isinstance: int, result: str) -> str:
+            return result
+
+        assert func(1, 'a') == 'a'
+        with raises(TypeError):
+            func('a', 'a')
+
+    def test_raise_error_when_type_different(self):
+        @strict(fast=True)
+        def func(a, r: List[int]):
+            return r
+
+        with raises(TypeError) as e:
+            func(1, 'foo')
+
+        assert str(e.value) == self.arg_msg % ('r', List[int], str)
+
+    def test_raise_error_for_keyword_only_argument(self):
+        @strict(fast=True)
+        def func(*, o: int = 0):
+            return o
+
+        with raises(TypeError) as e:
+            func(o='foo')
+
+        assert str(e.value) == self.arg_msg % ('o', int, str)
+
+    def test_raise_error_when_return_type_different(self):
+        @strict(fast=True)
+        def func(r) -> int:
+            return r
+
+        with raises(TypeError) as e:
+            func('foo')
+
+        assert str(e.value) == self.ret_msg % (int, str)
+
+    def test_share_code_of_identical_signatures(self):
+        def first(a: int) -> int:
+            return a
+
+        def second(a: int) -> int:
+            return a
+
+        first = strict(fast=True)(first)
+        second = strict(fast=True)(second)
+
+        assert first.__code__ is second.__code__
+
+    def test_fall_back_to_generic_wrapper_on_name_clash(self):
+        @strict(fast=True)
+        def func(_strict_func: int):
+            return _strict_func
+
+        assert func(1) == 1
+        with raises(TypeError):
+            func('foo')
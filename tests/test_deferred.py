@@ -0,0 +1,171 @@
+from asyncio import run
+from typing import List, Optional
+
+from pytest import fixture, mark
+
+from strict_hint import strict
+from strict_hint.deferred import (
+    Collector, collector, deferred, report, set_reporter
+)
+from strict_hint.errors import (
+    ArgumentTypeHintError, ReturnValueTypeHintError
+)
+from strict_hint.policy import Policy
+from strict_hint.strict_hint import Plan
+
+
+@fixture
+def reported():
+    errors = []
+    collector.drain()
+    set_reporter(errors.append)
+    yield errors
+    set_reporter(report)
+
+
+class TestDeferred:
+    def test_do_not_raise_inline(self, reported):
+        @strict(deferred=True)
+        def func(a: int) -> int:
+            return a
+
+        assert func('a') == 'a'
+        collector.drain()
+
+        assert len(reported) == 2
+        assert isinstance(reported[0], ArgumentTypeHintError)
+        assert isinstance(reported[1], ReturnValueTypeHintError)
+
+    @mark.parametrize('fast', [False, True])
+    def test_report_distinct_records_once(self, reported, fast):
+        @strict(deferred=True, fast=fast)
+        def func(a: int, b: str = 'b'):
+            pass
+
+        for _ in range(5):
+            func(1, b=2)
+        func(1, 'b')
+        collector.drain()
+
+        assert [error.argument_name for error in reported] == ['b']
+
+    def test_accept_default_and_none_result(self, reported):
+        @strict(deferred=True)
+        def func(a: int = None) -> Optional[int]:
+            return None
+
+        func()
+        func(None)
+        collector.drain()
+
+        assert reported == []
+
+    def test_check_only_container_class(self, reported):
+        @strict(deferred=True, strategy='full')
+        def func(a: List[int]):
+            pass
+
+        func(['a'])
+        func(('a',))
+        collector.drain()
+
+        assert [error.given_type for error in reported] == [tuple]
+
+    def test_generated_wrapper_records_packed_arguments(self, reported):
+        @strict(deferred=True, fast=True)
+        def func(a: int, *args, b: str, **kwargs) -> int:
+            return a
+
+        assert func(1, 'x', b=2, c=3) == 1
+        collector.drain()
+
+        assert [error.argument_name for error in reported] == ['b']
+
+    def test_parameters_named_as_builtins(self, reported):
+        @strict(deferred=True, fast=True)
+        def func(type: str, next: int, *map: int, result: str) -> int:
+            return next
+
+        assert func('a', 1, 2, result='b') == 1
+        func(1, 1, result='b')
+        collector.drain()
+
+        assert [error.argument_name for error in reported] == ['type']
+
+    def test_variadic_arguments(self, reported):
+        @strict(deferred=True)
+        def func(*values: int, **labels: str):
+            pass
+
+        func(1, 'a', x='x', y=2)
+        collector.drain()
+
+        assert [error.argument_name for error in reported] == ['values', 'y']
+
+    def test_coroutines(self, reported):
+        @strict(deferred=True)
+        async def func(a: int) -> str:
+            return a
+
+        assert run(func(1)) == 1
+        collector.drain()
+
+        assert isinstance(reported[0], ReturnValueTypeHintError)
+
+
+class TestCollector:
+    def test_overwrite_oldest_records(self):
+        errors = []
+        small = Collector(size=2, interval=60, callback=errors.append)
+
+        def func(a: int):
+            pass
+
+        wrapper = deferred(func, Plan(func), Policy(), small)
+        for value in ('a', 1.0, 1):
+            wrapper(value)
+        small.stop()
+
+        assert [error.given_type for error in errors] == [float]
+
+    def test_report_from_thread(self):
+        errors = []
+        background = Collector(interval=0.01, callback=errors.append)
+
+        @strict(deferred=True)
+        def func(a: int):
+            pass
+
+        plan = func.__strict_plan__
+        background.buffer[0] = (plan, (str,), (), type(None))
+        background.start()
+        background.stop()
+
+        assert len(errors) == 1
+        assert not background.thread.is_alive()
+
+    def test_survive_failing_callback(self, capsys):
+        errors = []
+
+        def callback(error):
+            errors.append(error)
+            raise RuntimeError('callback failed')
+
+        background = Collector(interval=0.01, callback=callback)
+
+        @strict(deferred=True)
+        def func(a: int):
+            pass
+
+        plan = func.__strict_plan__
+        background.buffer[0] = (plan, (str,), (), type(None))
+        background.buffer[1] = (plan, (float,), (), type(None))
+        background.start()
+        for _ in range(500):
+            if len(errors) == 2:
+                break
+            background.stopped.wait(0.01)
+
+        assert background.thread.is_alive()
+        background.stop()
+        assert 'callback failed' in capsys.readouterr().err
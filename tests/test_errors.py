@@ -0,0 +1,106 @@
+import pickle
+
+import pytest
+
+from strict_hint import strict
+from strict_hint.errors import (
+    ArgumentTypeHintError, ArgumentsTypeHintError, ReturnValueTypeHintError
+)
+
+
+class TestStructuredErrors:
+    def test_argument_fields(self):
+        @strict
+        def func(a: int, b: str):
+            pass
+
+        with pytest.raises(ArgumentTypeHintError) as info:
+            func(1, 2)
+
+        error = info.value
+        assert error.argument_name == 'b'
+        assert error.func_name == 'func'
+        assert error.expected_type is str
+        assert error.given_type is int
+        assert error.position == 1
+
+    def test_keyword_position(self):
+        @strict
+        def func(*, a: int):
+            pass
+
+        with pytest.raises(ArgumentTypeHintError) as info:
+            func(a='a')
+
+        assert info.value.position is None
+
+    def test_message(self):
+        error = ArgumentTypeHintError('a', 'func', int, str, 0)
+
+        assert str(error) == (
+            'Argument a passed to func must be an instance of '
+            "<class 'int'>, <class 'str'> given"
+        )
+
+    def test_return_fields(self):
+        @strict
+        def func() -> int:
+            return 'a'
+
+        with pytest.raises(ReturnValueTypeHintError) as info:
+            func()
+
+        assert info.value.expected_type is int
+        assert info.value.given_type is str
+
+    def test_pickle(self):
+        error = ArgumentTypeHintError('a', 'func', int, str, 0)
+
+        restored = pickle.loads(pickle.dumps(error))
+
+        assert restored.args == error.args
+        assert str(restored) == str(error)
+
+
+class TestCollect:
+    @pytest.mark.parametrize('fast', [False, True])
+    def test_report_all_arguments(self, fast):
+        @strict(collect=True, fast=fast)
+        def func(a: int, b: str, c: float = 0.0):
+            pass
+
+        with pytest.raises(ArgumentsTypeHintError) as info:
+            func('a', 1, c='c')
+
+        errors = info.value.errors
+        assert [error.argument_name for error in errors] == ['a', 'b', 'c']
+        assert info.value.argument_name == 'a'
+        assert str(info.value) == '; '.join(str(error) for error in errors)
+
+    def test_single_error_is_collected(self):
+        @strict(collect=True)
+        def func(a: int, b: str):
+            pass
+
+        with pytest.raises(ArgumentsTypeHintError) as info:
+            func(1, 2)
+
+        assert len(info.value.errors) == 1
+
+    def test_valid_call(self):
+        @strict(collect=True)
+        def func(a: int) -> int:
+            return a
+
+        assert func(1) == 1
+
+    def test_pickle(self):
+        error = ArgumentsTypeHintError([
+            ArgumentTypeHintError('a', 'func', int, str, 0),
+            ArgumentTypeHintError('b', 'func', str, int, 1),
+        ])
+
+        restored = pickle.loads(pickle.dumps(error))
+
+        assert len(restored.errors) == 2
+        assert str(restored) == str(error)
@@ -0,0 +1,230 @@
+import sys
+import warnings
+from dataclasses import FrozenInstanceError, InitVar, dataclass, field
+from typing import List, Optional
+
+from pytest import mark, raises
+
+from strict_hint import set_mode, strict_dataclass
+from strict_hint.errors import ArgumentTypeHintError, TypeHintWarning
+
+SLOTLESS = sys.version_info < (3, 10)
+
+
+@strict_dataclass
+@dataclass
+class Point:
+    x: int
+    y: int = 0
+    tags: List[str] = field(default_factory=list)
+    label: Optional[str] = None
+
+
+@strict_dataclass(setattr=True)
+@dataclass
+class Counter:
+    value: int
+    step: int = None
+
+
+class TestStrictDataclass:
+    def test_create_instance(self):
+        point = Point(1, 2, label='a')
+
+        assert (point.x, point.y, point.tags, point.label) == (1, 2, [], 'a')
+
+    def test_check_arguments(self):
+        with raises(ArgumentTypeHintError) as e:
+            Point('a')
+
+        assert e.value.argument_name == 'x'
+        assert e.value.func_name == 'Point.__init__'
+
+    def test_check_keyword_arguments(self):
+        with raises(ArgumentTypeHintError):
+            Point(1, tags='a')
+
+    def test_keep_generated_init_signature(self):
+        assert Point.__init__.__strict_plan__ is not None
+        with raises(TypeError):
+            Point()
+
+    @mark.skipif(
+        sys.version_info[:2] == (3, 10),
+        reason='generated init is not recognised on Python 3.10'
+    )
+    def test_replace_generated_init(self):
+        assert Point.__init__.__code__.co_filename == '<strict>'
+
+    @mark.skipif(SLOTLESS, reason='dataclass slots require Python 3.10')
+    @mark.parametrize('options', [
+        {'slots': True}, {'frozen': True}, {'slots': True, 'frozen': True}
+    ])
+    def test_slots_and_frozen(self, options):
+        @strict_dataclass
+        @dataclass(**options)
+        class Pair:
+            a: int
+            b: str = ''
+
+        assert Pair(1, 'b').b == 'b'
+        with raises(ArgumentTypeHintError):
+            Pair(1, 2)
+
+    def test_init_var_and_post_init(self):
+        @strict_dataclass
+        @dataclass
+        class Scaled:
+            value: int
+            factor: InitVar[int] = 1
+
+            def __post_init__(self, factor):
+                self.value *= factor
+
+        assert Scaled(2, 3).value == 6
+        with raises(ArgumentTypeHintError):
+            Scaled(2, 'a')
+
+    def test_string_annotations(self):
+        @strict_dataclass
+        @dataclass
+        class Node:
+            value: 'int'
+            parent: 'Optional[Node]' = None
+
+        Node(1, Node(2))
+        with raises(ArgumentTypeHintError):
+            Node(1, 2)
+
+    def test_fields_not_in_init(self):
+        @strict_dataclass
+        @dataclass
+        class Item:
+            name: str
+            count: int = field(default=0, init=False)
+            history: list = field(default_factory=list, init=False)
+
+        first, second = Item('a'), Item('b')
+
+        assert (first.count, first.history) == (0, [])
+        assert first.history is not second.history
+
+    def test_call_custom_init(self):
+        @strict_dataclass
+        @dataclass
+        class Item:
+            name: str
+
+            def __init__(self, name: str):
+                self.name = name.upper()
+
+        assert Item('a').name == 'A'
+        with raises(ArgumentTypeHintError):
+            Item(1)
+
+    def test_init_disabled(self):
+        @strict_dataclass
+        @dataclass(init=False)
+        class Item:
+            count: int = 0
+
+        item = Item()
+        item.count = 'a'
+        assert item.count == 'a'
+
+    def test_inherited_init(self):
+        @dataclass
+        class Base:
+            x: int
+
+        @strict_dataclass
+        @dataclass(init=False)
+        class Child(Base):
+            y: int = 0
+
+        child = Child(1)
+        assert (child.x, child.y) == (1, 0)
+        with raises(ArgumentTypeHintError):
+            Child('a')
+
+    def test_keep_body_of_executed_init(self):
+        namespace = {}
+        exec(
+            'def __init__(self, name: str):\n'
+            '    self.name = name.upper()', namespace
+        )
+
+        @strict_dataclass
+        @dataclass
+        class Item:
+            name: str
+            __init__ = namespace['__init__']
+
+        assert Item('a').name == 'A'
+        with raises(ArgumentTypeHintError):
+            Item(1)
+
+    def test_reject_other_classes(self):
+        with raises(TypeError):
+            strict_dataclass(object)
+
+
+class TestCheckedSetattr:
+    def test_check_assignment(self):
+        counter = Counter(1)
+        counter.value = 2
+
+        with raises(ArgumentTypeHintError):
+            counter.value = 'a'
+
+        assert counter.value == 2
+
+    def test_check_construction(self):
+        with raises(ArgumentTypeHintError):
+            Counter('a')
+
+    def test_accept_default(self):
+        counter = Counter(1, step=2)
+        counter.step = None
+
+        assert counter.step is None
+
+    def test_warn_mode(self):
+        counter = Counter(1)
+        set_mode('warn')
+        try:
+            with warnings.catch_warnings(record=True) as caught:
+                warnings.simplefilter('always')
+                counter.value = 'a'
+        finally:
+            set_mode('raise')
+
+        assert counter.value == 'a'
+        assert caught[0].category is TypeHintWarning
+
+    @mark.skipif(SLOTLESS, reason='dataclass slots require Python 3.10')
+    def test_slots(self):
+        @strict_dataclass(setattr=True)
+        @dataclass(slots=True)
+        class Pair:
+            a: int
+
+        pair = Pair(1)
+        with raises(ArgumentTypeHintError):
+            pair.a = 'a'
+
+    def test_reject_frozen(self):
+        with raises(TypeError):
+            @strict_dataclass(setattr=True)
+            @dataclass(frozen=True)
+            class Pair:
+                a: int
+
+    def test_frozen_still_frozen(self):
+        @strict_dataclass
+        @dataclass(frozen=True)
+        class Pair:
+            a: int
+
+        with raises(FrozenInstanceError):
+            Pair(1).a = 2
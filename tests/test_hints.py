@@ -0,0 +1,638 @@
+import gc
+import sys
+from abc import ABC
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import (
+    Annotated, Any, Callable, Dict, Final, FrozenSet, List, Literal, NewType,
+    Optional, Protocol, Set, Tuple, Type, TypedDict, TypeVar, Union,
+    runtime_checkable
+)
+
+from pytest import mark, raises
+
+from strict_hint import strict
+from strict_hint.hints import (
+    CachedHint, CallableHint, Hint, MemoHint, ProtocolHint, Strategy,
+    TypeCache, ValueCache, compile_hint, memoize, resolve_types
+)
+from strict_hint.strict_hint import Plan
+
+
+class TestResolveTypes:
+    def test_resolve_primitive(self):
+        assert resolve_types(int) is int
+
+    def test_resolve_list_of(self):
+        assert resolve_types([int]) is list
+
+    def test_resolve_tuple_of_types(self):
+        assert resolve_types((int, List[int])) == (int, list)
+
+    def test_resolve_typing_generics_to_origin(self):
+        assert resolve_types(Dict) is dict
+        assert resolve_types(List[int]) is list
+        assert resolve_types(Tuple[int, str]) is tuple
+
+    def test_resolve_union(self):
+        assert resolve_types(Union[int, str]) == (int, str)
+        assert resolve_types(Optional[str]) == (str, type(None))
+
+    def test_resolve_new_type_to_supertype(self):
+        UserId = NewType('UserId', int)
+
+        assert resolve_types(UserId) is int
+
+    def test_resolve_any(self):
+        assert resolve_types(Any) is object
+
+    def test_resolve_type_var(self):
+        assert resolve_types(TypeVar('T')) is object
+        assert resolve_types(TypeVar('T', bound=int)) is int
+        assert resolve_types(TypeVar('T', int, str)) == (int, str)
+
+    def test_compiled_hint_keeps_annotation(self):
+        assert compile_hint(List[int]).annotation == List[int]
+
+
+class TestCachedHint:
+    def test_compile_abc_to_cached_hint(self):
+        assert type(compile_hint(Mapping)) is CachedHint
+
+    def test_compile_concrete_class_to_plain_hint(self):
+        assert type(compile_hint(int)) is Hint
+
+    def test_remember_decision_per_class(self):
+        hint = compile_hint(Mapping)
+
+        assert hint.matches({}) is True
+        assert hint.matches([]) is False
+        assert hint.decisions == {id(dict): True, id(list): False}
+
+    def test_negative_decision_dropped_after_abc_register(self):
+        class Base(ABC):
+            pass
+
+        class Impl:
+            pass
+
+        hint = compile_hint(Base)
+        assert hint.matches(Impl()) is False
+
+        Base.register(Impl)
+
+        assert hint.matches(Impl()) is True
+
+    def test_cache_is_bounded(self):
+        cache = TypeCache(size=2)
+        classes = [type('C%d' % i, (), {}) for i in range(3)]
+        for cls in classes:
+            cache.store(cls, True)
+
+        assert len(cache) == 2
+        assert id(classes[0]) not in cache.decisions
+
+    def test_entry_dropped_when_class_collected(self):
+        cache = TypeCache()
+        cls = type('Temporary', (), {})
+        cache.store(cls, True)
+
+        del cls
+        gc.collect()
+
+        assert len(cache) == 0
+
+
+@runtime_checkable
+class Closable(Protocol):
+    def close(self) -> None:
+        ...
+
+
+@runtime_checkable
+class Named(Protocol):
+    name: str
+
+
+class Resource:
+    def close(self) -> None:
+        pass
+
+
+class TestProtocolHint:
+    def test_compile_runtime_protocols(self):
+        assert isinstance(compile_hint(Closable), ProtocolHint)
+        assert isinstance(compile_hint(Optional[Closable]), ProtocolHint)
+
+    def test_decide_once_per_class(self):
+        hint = compile_hint(Closable)
+
+        assert hint.matches(Resource())
+        assert hint.matches(Resource())
+        assert len(hint.cache) == 1
+        assert not hint.matches(object())
+        assert len(hint.cache) == 1
+
+    def test_match_plain_types_of_union(self):
+        hint = compile_hint(Optional[Closable])
+
+        assert hint.matches(None)
+        assert hint.matches(Resource())
+        assert not hint.matches(1)
+
+    def test_monkeypatch_invalidates_decision(self):
+        class Patched:
+            def close(self):
+                pass
+
+        hint = compile_hint(Closable)
+        assert hint.matches(Patched())
+
+        def close(self):
+            pass
+
+        Patched.close = close
+
+        assert hint.matches(Patched())
+        members, snapshot = hint.decisions[id(Patched)]
+        assert snapshot is close
+
+        del Patched.close
+
+        assert not hint.matches(Patched())
+
+    def test_reject_member_set_to_none(self):
+        class Disabled(Resource):
+            close = None
+
+        assert not compile_hint(Closable).matches(Disabled())
+
+    def test_do_not_cache_instance_members(self):
+        class Person:
+            def __init__(self, name):
+                self.name = name
+
+        hint = compile_hint(Named)
+
+        assert hint.matches(Person('a'))
+        assert len(hint.cache) == 0
+
+
+class TestContainerHint:
+    full = Strategy('full')
+
+    def test_shallow_ignores_elements(self):
+        assert compile_hint(List[int]).matches(['foo'])
+
+    def test_check_list_elements(self):
+        hint = compile_hint(List[int], self.full)
+
+        assert hint.matches([1, 2])
+        assert not hint.matches([1, 'foo'])
+
+    def test_check_list_of_annotation(self):
+        hint = compile_hint([int], self.full)
+
+        assert hint.matches([1])
+        assert not hint.matches(['foo'])
+
+    def test_check_set_elements(self):
+        assert compile_hint(Set[int], self.full).matches({1})
+        assert not compile_hint(FrozenSet[int], self.full).matches(
+            frozenset(['foo'])
+        )
+
+    def test_check_dict_keys_and_values(self):
+        hint = compile_hint(Dict[str, int], self.full)
+
+        assert hint.matches({'a': 1})
+        assert not hint.matches({1: 1})
+        assert not hint.matches({'a': 'a'})
+
+    def test_check_fixed_tuple_positions_and_size(self):
+        hint = compile_hint(Tuple[int, str], Strategy('first-k', k=1))
+
+        assert hint.matches((1, 'a'))
+        assert not hint.matches((1, 2))
+        assert not hint.matches((1,))
+
+    def test_check_variadic_tuple(self):
+        hint = compile_hint(Tuple[int, ...], self.full)
+
+        assert hint.matches((1, 2, 3))
+        assert not hint.matches((1, 'a'))
+
+    def test_check_nested_containers(self):
+        hint = compile_hint(List[Dict[str, int]], self.full)
+
+        assert not hint.matches([{'a': 'a'}])
+
+    def test_skip_elements_of_any(self):
+        assert type(compile_hint(List[Any], self.full)) is Hint
+
+    def test_first_k_checks_only_leading_elements(self):
+        hint = compile_hint(List[int], Strategy('first-k', k=2))
+
+        assert hint.matches([1, 2, 'foo'])
+        assert not hint.matches([1, 'foo', 3])
+
+    def test_sample_k_checks_k_elements(self):
+        strategy = Strategy('sample-k', k=3)
+        values = list(range(100))
+
+        assert len(strategy.sequence(values)) == 3
+        assert compile_hint(List[int], strategy).matches(values)
+        assert not compile_hint(List[int], strategy).matches(['a'] * 100)
+
+    def test_raise_error_for_unknown_strategy(self):
+        with raises(ValueError):
+            Strategy('some')
+
+    def test_decorator_checks_elements(self):
+        @strict(strategy='full')
+        def func(r: List[int]) -> Dict[str, int]:
+            return {'r': r[0]}
+
+        assert func([1]) == {'r': 1}
+        with raises(TypeError):
+            func(['foo'])
+
+
+class Point(TypedDict):
+    x: int
+    y: int
+
+
+class Options(TypedDict, total=False):
+    verbose: bool
+
+
+class TestModernForms:
+    full = Strategy('full')
+
+    @mark.skipif(sys.version_info < (3, 10), reason='requires PEP 604')
+    def test_pep_604_union(self):
+        hint = compile_hint(int | None)
+
+        assert type(hint) is Hint
+        assert hint.types == (int, type(None))
+
+    def test_literal(self):
+        hint = compile_hint(Literal['a', 'b', 1])
+
+        assert hint.matches('a')
+        assert hint.matches(1)
+        assert not hint.matches('c')
+        assert not hint.matches(True)
+        assert not hint.matches(['a'])
+
+    def test_optional_literal(self):
+        hint = compile_hint(Optional[Literal['a']])
+
+        assert hint.matches(None)
+        assert hint.matches('a')
+        assert not hint.matches('b')
+
+    def test_strip_annotated_and_final(self):
+        assert compile_hint(Annotated[int, 'meta']).types is int
+        assert compile_hint(Final[int]).types is int
+        assert compile_hint(
+            Annotated[List[int], 'meta'], self.full
+        ).matches([1])
+        assert not compile_hint(
+            Annotated[List[int], 'meta'], self.full
+        ).matches(['a'])
+
+    def test_typed_dict_keys(self):
+        hint = compile_hint(Point)
+
+        assert hint.matches({'x': 1, 'y': 2})
+        assert not hint.matches({'x': 1})
+        assert not hint.matches({'x': 1, 'y': 2, 'z': 3})
+        assert not hint.matches([('x', 1), ('y', 2)])
+
+    def test_typed_dict_optional_keys(self):
+        hint = compile_hint(Options)
+
+        assert hint.matches({})
+        assert hint.matches({'verbose': True})
+
+    def test_typed_dict_values_with_strategy(self):
+        assert compile_hint(Point).matches({'x': 'a', 'y': 2})
+        assert not compile_hint(Point, self.full).matches({'x': 'a', 'y': 2})
+
+    def test_subclass(self):
+        for annotation in (type[int], Type[int]):
+            hint = compile_hint(annotation)
+
+            assert hint.matches(bool)
+            assert not hint.matches(str)
+            assert not hint.matches(1)
+
+    def test_any_subclass(self):
+        assert type(compile_hint(Type[Any])) is Hint
+
+    def test_builtin_generics(self):
+        assert compile_hint(list[int], self.full).matches([1])
+        assert not compile_hint(list[int], self.full).matches(['a'])
+        assert not compile_hint(dict[str, int], self.full).matches({'a': 'a'})
+
+    def test_keep_element_checks_in_union(self):
+        hint = compile_hint(Optional[List[int]], self.full)
+
+        assert hint.matches(None)
+        assert not hint.matches(['a'])
+
+    def test_decorated_function(self):
+        @strict(fast=True)
+        def func(mode: Literal['r', 'w'], point: Point) -> Optional[int]:
+            return None
+
+        func('r', {'x': 1, 'y': 2})
+        with raises(TypeError):
+            func('x', {'x': 1, 'y': 2})
+
+
+class CountingHint(Hint):
+    __slots__ = ('calls',)
+
+    by_type = False
+
+    def __init__(self) -> None:
+        super().__init__(tuple, tuple)
+        self.calls = 0
+
+    def matches(self, value) -> bool:
+        self.calls += 1
+        return isinstance(value, tuple) and all(
+            isinstance(item, int) for item in value
+        )
+
+
+@dataclass(frozen=True)
+class Frozen:
+    items: tuple
+
+
+def callback(a: int, b: str) -> bool:
+    return True
+
+
+class Handler:
+    def handle(self, a: int, b) -> bool:
+        return True
+
+    def __call__(self, a, b) -> bool:
+        return True
+
+
+class TestCallableHint:
+    hint = compile_hint(Callable[[int, str], bool])
+
+    def test_compile(self):
+        assert type(self.hint) is CallableHint
+        assert self.hint.params == (int, str)
+        assert self.hint.result is bool
+        assert type(compile_hint(Callable)) is CachedHint
+        assert type(compile_hint(Callable[..., Any])) is CachedHint
+        assert compile_hint(Callable[..., int]).params is None
+        assert compile_hint(Callable[[int], None]).result is None
+
+    def test_matching_signatures(self):
+        def variadic(*args: object) -> bool:
+            return True
+
+        def defaults(a, b, c=None):
+            pass
+
+        assert self.hint.matches(callback)
+        assert self.hint.matches(variadic)
+        assert self.hint.matches(defaults)
+        assert self.hint.matches(lambda a, b: None)
+        assert self.hint.matches(Handler().handle)
+        assert self.hint.matches(Handler())
+
+    def test_incompatible_signatures(self):
+        def narrower(a: bool, b: str) -> bool:
+            return True
+
+        def wider_result(a: int, b: str) -> int:
+            return 1
+
+        def keyword_only(a, *, b):
+            pass
+
+        assert not self.hint.matches(1)
+        assert not self.hint.matches(narrower)
+        assert not self.hint.matches(wider_result)
+        assert not self.hint.matches(keyword_only)
+        assert not self.hint.matches(lambda a: None)
+        assert not self.hint.matches(lambda a, b, c: None)
+        assert not self.hint.matches(len)
+
+    def test_arguments_not_checked_for_ellipsis(self):
+        hint = compile_hint(Callable[..., bool])
+
+        assert hint.matches(lambda *args: True)
+        assert hint.matches(callback)
+        assert not hint.matches(Handler)
+
+    def test_class_returns_its_instances(self):
+        class Point:
+            def __init__(self, x: int, y: str) -> None:
+                pass
+
+        assert compile_hint(Callable[[int, str], Point]).matches(Point)
+        assert not compile_hint(Callable[[int, str], Handler]).matches(Point)
+
+    def test_cached_per_callable(self):
+        hint = compile_hint(Callable[[int, str], bool])
+
+        assert hint.matches(callback)
+        assert hint.matches(callback)
+        assert hint.matches(Handler().handle)
+        assert hint.matches(Handler().handle)
+        assert len(hint.cache) == 1
+        assert len(hint.methods) == 1
+
+    def test_closures_of_same_definition_are_decided_apart(self):
+        hint = compile_hint(Callable[[str], bool])
+
+        def make(cls):
+            def handler(x: cls) -> bool:
+                return True
+            return handler
+
+        accepted, rejected = make(str), make(int)
+        assert hint.matches(accepted)
+        assert not hint.matches(rejected)
+
+    def test_shared_hint_decides_closures_apart(self):
+        @strict
+        def first(func: Callable[[str], bool]) -> None:
+            pass
+
+        @strict
+        def second(func: Callable[[str], bool]) -> None:
+            pass
+
+        def make(cls):
+            def handler(x: cls) -> bool:
+                return True
+            return handler
+
+        first(make(str))
+        with raises(TypeError):
+            second(make(int))
+
+    def test_forget_collected_callables(self):
+        hint = compile_hint(Callable[[int, str], bool])
+        handler = Handler()
+
+        assert hint.matches(handler)
+        assert len(hint.cache) == 1
+
+        del handler
+        gc.collect()
+        assert len(hint.cache) == 0
+
+    def test_decorated_function(self):
+        @strict
+        def run(func: Callable[[int, str], bool]) -> bool:
+            return func(1, 'a')
+
+        assert run(callback)
+        with raises(TypeError):
+            run(lambda a: True)
+
+
+@dataclass
+class Mutable:
+    items: tuple
+
+
+class TestMemoHint:
+    def test_remember_passed_immutable_values(self):
+        inner = CountingHint()
+        hint = MemoHint(inner)
+        value = (1, 2, 3)
+
+        assert hint.matches(value)
+        assert hint.matches(value)
+        assert inner.calls == 1
+
+    def test_recheck_failed_values(self):
+        inner = CountingHint()
+        hint = MemoHint(inner)
+
+        assert not hint.matches(('a',))
+        assert not hint.matches(('a',))
+        assert inner.calls == 2
+
+    def test_skip_values_holding_mutable_ones(self):
+        hint = MemoHint(compile_hint(Tuple[list, ...], Strategy('full')))
+
+        hint.matches(([1],))
+        hint.matches(Mutable(()))
+
+        assert len(hint.cache) == 0
+
+    def test_remember_frozen_dataclasses(self):
+        hint = MemoHint(Hint(Frozen, Frozen))
+        value = Frozen((1,))
+
+        assert hint.matches(value)
+        assert len(hint.cache) == 1
+
+        del value
+        gc.collect()
+
+        assert len(hint.cache) == 0
+
+    def test_evict_oldest_value(self):
+        cache = ValueCache(size=2)
+        values = [(i,) for i in range(3)]
+        for value in values:
+            cache.store(value)
+
+        assert len(cache) == 2
+        assert values[0] not in cache
+        assert values[2] in cache
+
+    def test_equal_value_is_not_same(self):
+        cache = ValueCache()
+        cache.store(frozenset([1]))
+
+        assert frozenset([1]) not in cache
+
+    def test_disabled_by_default(self):
+        hint = compile_hint(Tuple[int, ...], Strategy('full'))
+
+        assert memoize(hint, Strategy('full')) is hint
+        assert isinstance(memoize(hint, Strategy('full', memo=8)), MemoHint)
+
+    def test_skip_hints_deciding_by_type(self):
+        hint = compile_hint(int)
+
+        assert memoize(hint, Strategy('full', memo=8)) is hint
+
+    def test_decorator_option(self):
+        @strict(strategy='full', memo=8)
+        def func(a: Tuple[int, ...]):
+            pass
+
+        value = (1, 2)
+        func(value)
+
+        assert value in func.__strict_plan__.positional[0].hint.cache
+        with raises(TypeError):
+            func((1, 'a'))
+
+
+class TestPlan:
+    def test_positional_checks_are_indexed(self):
+        def func(a, b: int, c=None):
+            pass
+
+        plan = Plan(func)
+
+        assert plan.positional[0] is None
+        assert plan.positional[1].name == 'b'
+        assert len(plan.positional) == 2
+
+    def test_keyword_checks_are_keyed_by_name(self):
+        def func(a: int, *args, b: str = ''):
+            pass
+
+        assert sorted(Plan(func).keywords) == ['a', 'b']
+
+    def test_no_return_check_without_annotation(self):
+        def func():
+            pass
+
+        assert Plan(func).returns is None
+
+    def test_share_layout_of_identical_signatures(self):
+        def first(self, x: int) -> int:
+            pass
+
+        def second(self, x: int) -> int:
+            pass
+
+        assert Plan(first).layout is Plan(second).layout
+        assert Plan(first).func_name != Plan(second).func_name
+
+    def test_do_not_share_layout_of_different_defaults(self):
+        def first(x: int = 0):
+            pass
+
+        def second(x: int = None):
+            pass
+
+        assert Plan(first).layout is not Plan(second).layout
+
+    def test_build_layout_for_unhashable_annotation(self):
+        def func(x: [int] = []):
+            pass
+
+        assert Plan(func).positional[0].name == 'x'
@@ -0,0 +1,111 @@
+from asyncio import run
+from inspect import isasyncgenfunction
+
+from pytest import fixture, raises, warns
+
+from strict_hint import strict, enable_stats, stats, reset_stats
+from strict_hint.errors import TypeHintWarning
+from strict_hint.instrument import registry
+
+
+@fixture(autouse=True)
+def clean_registry():
+    yield
+    enable_stats(False)
+    registry.records.clear()
+
+
+def stats_of(func) -> dict:
+    return stats()['%s.%s' % (func.__module__, func.__qualname__)]
+
+
+class TestInstrument:
+    def test_not_instrumented_by_default(self):
+        @strict
+        def func(r: int):
+            return r
+
+        func(1)
+
+        assert stats() == {}
+
+    def test_count_calls_checks_and_failures(self):
+        @strict(instrument=True)
+        def func(r: int) -> int:
+            return r
+
+        func(1)
+        with raises(TypeError):
+            func('foo')
+
+        record = stats_of(func)
+        assert record['calls'] == 2
+        assert record['checked'] == 2
+        assert record['failures'] == 1
+        assert record['check_time'] > 0
+        assert record['call_time'] > 0
+
+    def test_count_skipped_checks(self):
+        @strict(instrument=True, mode='sample', every=2)
+        def func(r: int):
+            return r
+
+        for _ in range(4):
+            func(1)
+
+        assert stats_of(func)['skipped'] == 2
+        assert stats_of(func)['checked'] == 2
+
+    def test_count_warned_failures(self):
+        @strict(instrument=True, mode='warn')
+        def func(r: int) -> int:
+            return r
+
+        with warns(TypeHintWarning):
+            assert func('foo') == 'foo'
+
+        assert stats_of(func)['failures'] == 2
+
+    def test_instrument_when_enabled_before_decoration(self):
+        enable_stats()
+
+        @strict
+        def func(r: int):
+            return r
+
+        func(1)
+
+        assert stats_of(func)['calls'] == 1
+
+    def test_instrument_coroutine(self):
+        @strict(instrument=True)
+        async def func(r: int) -> int:
+            return r
+
+        assert run(func(1)) == 1
+        with raises(TypeError):
+            run(func('foo'))
+
+        assert stats_of(func)['failures'] == 1
+
+    def test_instrument_async_generator(self):
+        @strict(instrument=True)
+        async def func(r: int):
+            yield r
+
+        async def consume(items):
+            return [item async for item in items]
+
+        assert isasyncgenfunction(func)
+        assert run(consume(func(1))) == [1]
+        assert stats_of(func)['calls'] == 1
+
+    def test_reset_counters(self):
+        @strict(instrument=True)
+        def func(r: int):
+            return r
+
+        func(1)
+        reset_stats()
+
+        assert stats_of(func)['calls'] == 0
@@ -0,0 +1,104 @@
+from asyncio import run
+from inspect import iscoroutinefunction
+from threading import Barrier, Thread
+from unittest.mock import patch
+
+from pytest import raises
+
+from strict_hint import strict, check_batch, warm
+from strict_hint.errors import ArgumentTypeHintError
+from strict_hint.strict_hint import pending
+
+
+class TestLazy:
+    def test_build_plan_on_first_call(self):
+        @strict(lazy=True)
+        def func(a: int) -> int:
+            return a
+
+        assert func.__strict_plan__ is None
+        assert func in pending
+
+        assert func(1) == 1
+        assert func.__strict_plan__ is not None
+        assert func not in pending
+        with raises(ArgumentTypeHintError):
+            func('a')
+
+    def test_do_not_inspect_at_decoration(self):
+        with patch('strict_hint.strict_hint.signature') as signature:
+            @strict(lazy=True, fast=True)
+            def func(a: int) -> int:
+                return a
+
+        signature.assert_not_called()
+        assert func(1) == 1
+
+    def test_build_once_from_many_threads(self):
+        @strict(lazy=True)
+        def func(a: int) -> int:
+            return a
+
+        barrier = Barrier(8)
+        plans = []
+
+        def work():
+            barrier.wait()
+            func(1)
+            plans.append(func.__strict_plan__)
+
+        threads = [Thread(target=work) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(set(map(id, plans))) == 1
+
+    def test_keep_coroutine_function(self):
+        @strict(lazy=True)
+        async def func(a: int) -> int:
+            return a
+
+        assert iscoroutinefunction(func)
+        assert run(func(1)) == 1
+        with raises(ArgumentTypeHintError):
+            run(func('a'))
+
+    def test_decorate_class(self):
+        @strict(lazy=True)
+        class Calculator:
+            def add(self, a: int, b: int) -> int:
+                return a + b
+
+        assert Calculator().add(1, 2) == 3
+        with raises(ArgumentTypeHintError):
+            Calculator().add(1, 'a')
+
+    def test_check_batch(self):
+        @strict(lazy=True)
+        def func(a: int):
+            pass
+
+        assert len(check_batch(func, [(1,), ('a',)])) == 1
+
+
+class TestWarm:
+    def test_build_pending_plans(self):
+        @strict(lazy=True)
+        def func(a: int):
+            pass
+
+        warm()
+
+        assert func.__strict_plan__ is not None
+        assert func not in pending
+
+    def test_build_in_background(self):
+        @strict(lazy=True)
+        def func(a: int):
+            pass
+
+        warm(background=True).join()
+
+        assert func.__strict_plan__ is not None
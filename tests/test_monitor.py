@@ -0,0 +1,125 @@
+import sys
+import warnings
+from typing import List
+
+from pytest import fixture, raises, skip
+
+if sys.version_info < (3, 12):
+    skip('sys.monitoring requires Python 3.12', allow_module_level=True)
+
+from strict_hint import monitor  # noqa: E402
+from strict_hint.errors import (  # noqa: E402
+    ArgumentTypeHintError, ReturnValueTypeHintError, TypeHintWarning
+)
+
+
+def add(a: int, b: int = 0, *, scale: int = 1) -> int:
+    return (a + b) * scale
+
+
+def show(a) -> str:
+    return a
+
+
+def numbers(count: int) -> List[int]:
+    for i in range(count):
+        yield i
+
+
+@fixture(autouse=True)
+def detach_all():
+    yield
+    monitor.disable()
+    monitor.set_mode('raise')
+
+
+class TestMonitor:
+    def test_check_arguments(self):
+        monitor.attach(add)
+
+        assert add(1, 2) == 3
+        with raises(ArgumentTypeHintError):
+            add('a')
+        with raises(ArgumentTypeHintError):
+            add(1, scale='a')
+
+    def test_check_return_value(self):
+        monitor.attach(show)
+
+        with raises(ReturnValueTypeHintError):
+            show(1)
+
+    def test_keep_identity(self):
+        func = add
+        monitor.attach(add)
+
+        assert add is func
+        assert monitor.monitor.attached == (add.__code__,)
+
+    def test_attach_bound_methods(self):
+        class Scaled:
+            def scale(self, a: int) -> int:
+                return a * 2
+
+            @classmethod
+            def create(cls, a: int) -> int:
+                return a
+
+        monitor.attach(Scaled().scale, Scaled.create)
+
+        assert Scaled().scale(2) == 4
+        assert Scaled.create(1) == 1
+        with raises(ArgumentTypeHintError) as e:
+            Scaled().scale('a')
+        assert e.value.argument_name == 'a'
+        with raises(ArgumentTypeHintError):
+            Scaled.create('a')
+
+        monitor.detach(Scaled().scale)
+        assert Scaled().scale('a') == 'aa'
+
+    def test_detach(self):
+        monitor.attach(add, show)
+        monitor.detach(add)
+
+        assert add('a', 'b') == 'ab'
+        with raises(ReturnValueTypeHintError):
+            show(1)
+
+    def test_release_tool_when_disabled(self):
+        monitor.attach(add)
+        tool = monitor.monitor.tool
+
+        monitor.disable()
+
+        assert sys.monitoring.get_tool(tool) is None
+        assert add('a', 'b') == 'ab'
+
+    def test_skip_generator_result(self):
+        monitor.attach(numbers)
+
+        assert list(numbers(2)) == [0, 1]
+        with raises(ArgumentTypeHintError):
+            list(numbers('a'))
+
+    def test_check_variadic_arguments(self):
+        def total(*values: int, **labels: str) -> int:
+            return sum(values)
+
+        monitor.attach(total)
+
+        assert total(1, 2, a='a') == 3
+        with raises(ArgumentTypeHintError):
+            total(1, 'a')
+        with raises(ArgumentTypeHintError):
+            total(1, a=1)
+
+    def test_warn_mode(self):
+        monitor.set_mode('warn')
+        monitor.attach(add)
+
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter('always')
+            assert add('a', 'b') == 'ab'
+
+        assert caught[0].category is TypeHintWarning
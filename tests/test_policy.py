@@ -0,0 +1,109 @@
+from pytest import fixture, raises, warns
+
+from strict_hint import strict, set_mode, get_mode
+from strict_hint.errors import TypeHintWarning
+from strict_hint.policy import Policy
+
+
+@fixture(autouse=True)
+def restore_mode():
+    yield
+    set_mode('raise', every=1)
+
+
+class TestPolicy:
+    def test_default_mode_is_raise(self):
+        assert Policy().mode == 'raise'
+
+    def test_raise_error_for_unknown_mode(self):
+        with raises(ValueError):
+            Policy('loud')
+
+    def test_rate_converted_to_every(self):
+        assert Policy('sample', rate=0.01).every == 100
+
+    def test_read_mode_and_every_from_env(self):
+        policy = Policy.from_env(
+            {'STRICT_HINT_MODE': 'sample', 'STRICT_HINT_SAMPLE': '10'}
+        )
+
+        assert (policy.mode, policy.every) == ('sample', 10)
+
+    def test_read_rate_from_env(self):
+        policy = Policy.from_env({'STRICT_HINT_SAMPLE': '0.5'})
+
+        assert (policy.mode, policy.every) == ('raise', 2)
+
+
+class TestDecoratorMode:
+    def test_return_original_function_when_off(self):
+        def func(r: int):
+            return r
+
+        assert strict(mode='off')(func) is func
+
+    def test_warn_instead_of_raise(self):
+        @strict(mode='warn')
+        def func(r: int) -> int:
+            return r
+
+        with warns(TypeHintWarning) as record:
+            assert func('foo') == 'foo'
+
+        assert len(record) == 2
+
+    def test_check_every_nth_call_when_sampling(self):
+        @strict(mode='sample', every=3)
+        def func(r: int):
+            return r
+
+        assert func('foo') == 'foo'
+        assert func('foo') == 'foo'
+        with raises(TypeError):
+            func('foo')
+        assert func('foo') == 'foo'
+
+    def test_fast_wrapper_follows_mode(self):
+        @strict(fast=True, mode='warn')
+        def func(r: int, *args, o: int = 0, **kwargs):
+            return r, args, o, kwargs
+
+        with warns(TypeHintWarning):
+            assert func('r', 1, o='o', x=2) == ('r', (1,), 'o', {'x': 2})
+
+
+class TestGlobalMode:
+    def test_switch_mode_at_runtime(self):
+        @strict
+        def func(r: int):
+            return r
+
+        set_mode('off')
+        assert get_mode() == 'off'
+        assert func('foo') == 'foo'
+
+        set_mode('raise')
+        with raises(TypeError):
+            func('foo')
+
+    def test_check_function_decorated_while_off(self):
+        set_mode('off')
+
+        @strict(fast=True)
+        def func(r: int):
+            return r
+
+        assert func('foo') == 'foo'
+
+        set_mode('raise')
+        with raises(TypeError):
+            func('foo')
+
+    def test_decorator_mode_overrides_global(self):
+        @strict(mode='raise')
+        def func(r: int):
+            return r
+
+        set_mode('off')
+        with raises(TypeError):
+            func('foo')
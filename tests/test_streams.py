@@ -0,0 +1,148 @@
+from contextlib import contextmanager
+from typing import Generator, Iterator, List
+
+from pytest import raises, warns
+
+from strict_hint import strict
+from strict_hint.errors import TypeHintWarning, YieldValueTypeHintError
+
+
+class TestIteratorReturnValue:
+    error_msg = "Value yielded by func must be an instance of %s, %s yielded"
+
+    def test_accept_valid_items(self):
+        @strict
+        def func(r) -> Iterator[int]:
+            return iter(r)
+
+        assert list(func([1, 2])) == [1, 2]
+
+    def test_check_items_lazily(self):
+        @strict
+        def func(r) -> Iterator[int]:
+            return iter(r)
+
+        items = func([1, 'foo'])
+
+        assert next(items) == 1
+        with raises(YieldValueTypeHintError) as e:
+            next(items)
+
+        assert str(e.value) == self.error_msg % (int, str)
+
+    def test_raise_error_when_not_iterator(self):
+        @strict
+        def func(r) -> Iterator[int]:
+            return r
+
+        with raises(TypeError):
+            func([1])
+
+    def test_fast_wrapper_checks_items(self):
+        @strict(fast=True)
+        def func(r) -> Iterator[int]:
+            return iter(r)
+
+        with raises(YieldValueTypeHintError):
+            list(func(['foo']))
+
+    def test_warn_for_invalid_item(self):
+        @strict(mode='warn')
+        def func(r) -> Iterator[int]:
+            return iter(r)
+
+        with warns(TypeHintWarning):
+            assert list(func(['foo'])) == ['foo']
+
+    def test_pass_close_through_to_generator(self):
+        closed = []
+
+        @strict
+        def func(r: int) -> Iterator[int]:
+            try:
+                yield r
+                yield r
+            finally:
+                closed.append(True)
+
+        gen = func(1)
+        assert next(gen) == 1
+        gen.close()
+
+        assert closed == [True]
+
+    def test_context_manager(self):
+        @contextmanager
+        @strict
+        def opened(r) -> Iterator[int]:
+            yield r
+
+        with opened(1) as value:
+            assert value == 1
+
+        with raises(KeyError):
+            with opened(1):
+                raise KeyError('inside')
+
+        with raises(YieldValueTypeHintError):
+            with opened('a'):
+                pass
+
+
+class TestGeneratorReturnValue:
+    def test_check_yielded_items(self):
+        @strict
+        def func() -> Generator[int, None, None]:
+            yield 1
+            yield 'foo'
+
+        with raises(YieldValueTypeHintError):
+            list(func())
+
+    def test_pass_send_through(self):
+        @strict
+        def func() -> Generator[int, int, None]:
+            received = yield 0
+            while True:
+                received = yield received * 2
+
+        gen = func()
+
+        assert next(gen) == 0
+        assert gen.send(2) == 4
+        with raises(YieldValueTypeHintError):
+            gen.send('a')
+
+    def test_pass_throw_and_close_through(self):
+        @strict
+        def func() -> Generator[int, None, None]:
+            try:
+                yield 1
+            except ValueError:
+                yield 2
+
+        gen = func()
+        next(gen)
+
+        assert gen.throw(ValueError) == 2
+        gen.close()
+        assert gen.gi_frame is None
+
+    def test_check_returned_value(self):
+        @strict
+        def func() -> Generator[int, None, str]:
+            yield 1
+            return 2
+
+        with raises(TypeError) as e:
+            list(func())
+
+        assert 'Value returned by func' in str(e.value)
+
+    def test_check_nested_item_hints(self):
+        @strict(strategy='full')
+        def func() -> Iterator[List[int]]:
+            yield ['foo']
+
+        with raises(YieldValueTypeHintError):
+            list(func())
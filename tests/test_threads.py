@@ -0,0 +1,84 @@
+from threading import Thread
+
+from pytest import raises
+
+from strict_hint import strict
+from strict_hint.strict_hint import StrictHint
+
+
+class TestReusedInstance:
+    def test_keep_checks_of_each_decorated_function(self):
+        decorator = StrictHint()
+
+        @decorator
+        def first(r: int) -> int:
+            return r
+
+        @decorator
+        def second(r: str) -> str:
+            return r
+
+        assert first(1) == 1
+        assert second('a') == 'a'
+        with raises(TypeError) as e:
+            first('a')
+
+        assert 'passed to first' in str(e.value)
+
+    def test_instance_is_not_extended(self):
+        with raises(AttributeError):
+            StrictHint().extra = 1
+
+
+class TestThreads:
+    def test_check_calls_from_many_threads(self):
+        decorator = strict(fast=True)
+        funcs = []
+        errors = []
+
+        def work(index: int) -> None:
+            @decorator
+            def func(r: int) -> int:
+                return r
+
+            funcs.append(func)
+            for i in range(1000):
+                if func(i) != i:
+                    errors.append(i)
+            try:
+                func('a')
+            except TypeError:
+                pass
+            else:
+                errors.append(index)
+
+        threads = [Thread(target=work, args=(i,)) for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert errors == []
+        assert len(funcs) == 8
+
+    def test_sample_every_nth_call_across_threads(self):
+        calls = []
+
+        @strict(mode='sample', every=10)
+        def func(r: int):
+            return r
+
+        def work() -> None:
+            for _ in range(100):
+                try:
+                    func('a')
+                except TypeError:
+                    calls.append(1)
+
+        threads = [Thread(target=work) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(calls) == 40
@@ -0,0 +1,111 @@
+from pytest import mark, raises
+
+from strict_hint import check_batch, strict
+from strict_hint.errors import ArgumentTypeHintError, ArgumentsTypeHintError
+
+VARIANTS = [{}, {'fast': True}]
+
+
+class TestVarPositional:
+    @mark.parametrize('options', VARIANTS)
+    def test_check_each_item(self, options):
+        @strict(**options)
+        def func(a: str, *values: int) -> int:
+            return len(values)
+
+        assert func('a', 1, 2, 3) == 3
+        with raises(ArgumentTypeHintError) as e:
+            func('a', 1, 'b', 3)
+
+        assert e.value.argument_name == 'values'
+        assert e.value.position == 2
+        assert e.value.given_type is str
+
+    def test_do_not_misattribute_items(self):
+        @strict
+        def func(a, b: int = 0, *rest: str):
+            pass
+
+        func(1, 2, 'x')
+        with raises(ArgumentTypeHintError) as e:
+            func(1, 2, 3)
+
+        assert e.value.argument_name == 'rest'
+
+    def test_ignore_unannotated(self):
+        @strict
+        def func(a: int, *rest):
+            pass
+
+        func(1, 'a', None)
+
+    def test_cap_checked_items(self):
+        @strict(strategy='first-k', k=2)
+        def func(*values: int):
+            pass
+
+        func(1, 2, 'c')
+        with raises(ArgumentTypeHintError):
+            func(1, 'b', 3)
+
+
+class TestVarKeyword:
+    @mark.parametrize('options', VARIANTS)
+    def test_check_each_value(self, options):
+        @strict(**options)
+        def func(a: int = 0, **labels: str):
+            pass
+
+        func(a=1, x='x', y='y')
+        with raises(ArgumentTypeHintError) as e:
+            func(a=1, x=1)
+
+        assert e.value.argument_name == 'x'
+        assert e.value.position is None
+
+    def test_skip_named_parameters(self):
+        @strict
+        def func(a, *, b=None, **labels: str):
+            pass
+
+        func(a=1, b=2, c='c')
+
+    def test_positional_only_name_goes_to_kwargs(self):
+        @strict
+        def func(a, /, **labels: str):
+            pass
+
+        with raises(ArgumentTypeHintError):
+            func(1, a=1)
+
+    def test_cap_checked_values(self):
+        @strict(strategy='first-k', k=1)
+        def func(**labels: str):
+            pass
+
+        func(x='x', y=2)
+        with raises(ArgumentTypeHintError):
+            func(x=1, y='y')
+
+
+class TestReporting:
+    def test_collect_all(self):
+        @strict(collect=True)
+        def func(*values: int, **labels: str):
+            pass
+
+        with raises(ArgumentsTypeHintError) as e:
+            func(1, 'a', 'b', x=1)
+
+        assert [error.position for error in e.value.errors] == [1, 2, None]
+
+    def test_check_batch(self):
+        @strict
+        def func(a: int, *values: int, **labels: str):
+            pass
+
+        violations = check_batch(func, [(1, 2), (1, 'a'), {'a': 1, 'x': 1}])
+
+        assert [(v.row, v.argument_name) for v in violations] == [
+            (1, 'values'), (2, 'x')
+        ]